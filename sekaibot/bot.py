@@ -45,6 +45,15 @@ __all__ = [
 ]
 
 
+class _NodeStateDict(dict[str, Any]):
+    """节点状态字典，读取未初始化的节点状态时返回 `None`，且不会写入新的键。"""
+
+    __slots__ = ()
+
+    def __missing__(self, key: str) -> None:
+        return None
+
+
 class Bot:
     config: MainConfig
     manager: NodeManager
@@ -129,7 +138,7 @@ class Bot:
         self.manager = NodeManager(self)
         self.nodes_tree = {}
         self.nodes_list = []
-        self.node_state = defaultdict(lambda: None)
+        self.node_state = _NodeStateDict()
         self.adapters = []
         self.plugin_dict = defaultdict(lambda: None)
         self.global_state = defaultdict(dict)
@@ -395,6 +404,8 @@ class Bot:
         for node_class, load_type, file_path in nodes:
             node_class.__node_load_type__ = load_type
             node_class.__node_file_path__ = file_path
+            # EventType 可能在类定义之后才被设置，加载时重新生成判断函数
+            node_class._update_event_checker()
             if node_class.__name__ in nodes_dict:
                 logger.warning("Already have a same name node", name=node_class.__name__)
             nodes_dict[node_class.__name__] = node_class
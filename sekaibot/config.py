@@ -40,6 +40,12 @@ class BotConfig(ConfigModel):
     """Bot 相关设置。"""
 
     event_queue_size: int = Field(default=0, ge=0)
+    event_workers: int = Field(default=0, ge=0)
+    """常驻事件处理任务的数量，为 0 时每个事件创建一个任务。
+
+    常驻任务全部繁忙时（例如都在 `get()`/`ask()` 中等待后续事件），新事件会直接创建任务处理，
+    不会等待空闲的常驻任务，以免接收循环阻塞导致等待的事件无法送达。
+    """
     nodes: set[str] = Field(default_factory=set)
     node_dirs: set[DirectoryPath] = Field(default_factory=set)
     adapters: set[str] = Field(default_factory=set)
@@ -16,11 +16,17 @@ if TYPE_CHECKING:
 
 _T = TypeVar("_T")
 
+_DEFAULT_INNER_DEPENDS = InnerDepends()
+"""无参数 `Depends()` 共享的子依赖对象，解析时不会被修改"""
+_bot_class: type["Bot"] | None = None
+"""延迟导入的 `Bot` 类"""
+
 
 __all__ = [
     "Depends",
     "Dependency",
     "InnerDepends",
+    "seed_dependency_cache",
     "solve_dependencies",
     "solve_dependencies_in_bot",
 ]
@@ -38,9 +44,53 @@ def Depends(  # noqa: N802 # pylint: disable=invalid-name
     Returns:
         返回内部子依赖对象。
     """
+    if dependency is None and use_cache:
+        return _DEFAULT_INNER_DEPENDS  # type: ignore
     return InnerDepends(dependency=dependency, use_cache=use_cache)  # type: ignore
 
 
+def seed_dependency_cache(
+    dependency_cache: DependencyCacheT,
+    *,
+    bot: "Bot",
+    event: Event[Any] | None = None,
+    global_state: GlobalStateT | None = None,
+) -> DependencyCacheT:
+    """向依赖缓存中写入在同一事件的处理过程中保持不变的上下文。
+
+    处理事件时只需在开始时调用一次，之后的 `solve_dependencies_in_bot()`
+    在上下文未改变时不会重复写入这些键。
+
+    Args:
+        dependency_cache: 依赖缓存，会被原地更新。
+        bot: 机器人实例。
+        event: 事件对象。
+        global_state: 为节点提供的全局状态。
+
+    Returns:
+        更新后的依赖缓存。
+    """
+    global _bot_class
+    if _bot_class is None:
+        # 延迟导入以避免循环导入，仅在首次调用时执行
+        from sekaibot.bot import Bot
+
+        _bot_class = Bot
+
+    dependency_cache.update(
+        {
+            _bot_class: bot,
+            "bot": bot,
+            Event: event,
+            "event": event,
+            GlobalStateT: global_state,
+            "global_state": global_state,
+            DependencyCacheT: dependency_cache,
+        }
+    )
+    return dependency_cache
+
+
 async def solve_dependencies_in_bot(
     dependent: Dependency[_T],
     *,
@@ -68,33 +118,31 @@ async def solve_dependencies_in_bot(
         use_cache: 是否使用缓存，默认为 `True`。
         stack: 异步上下文管理器，可选。
         dependency_cache: 依赖缓存，如果未提供，则自动创建新字典。
+            传入的字典会被原地更新，以便同一事件中的多次解析共享已解析的依赖。
 
     Returns:
         解析后的依赖对象。
     """
-    from sekaibot.bot import Bot
-
     if dependency_cache is None:
         dependency_cache = {}
+    if (
+        dependency_cache.get(DependencyCacheT) is not dependency_cache
+        or dependency_cache.get("bot") is not bot
+        or dependency_cache.get("event") is not event
+        or dependency_cache.get("global_state") is not global_state
+    ):
+        seed_dependency_cache(dependency_cache, bot=bot, event=event, global_state=global_state)
     dependency_cache.update(
         {
-            Bot: bot,
-            "bot": bot,
-            Event: event,
-            "event": event,
             StateT: state,
             "state": state,
-            GlobalStateT: global_state,
-            "global_state": global_state,
             NodeStateT: node_state,
             "node_state": node_state,
         }
     )
-    if dependency_cache is not None:
-        dependency_cache.update({DependencyCacheT: dependency_cache})
-    for key, value in kwargs.items():
-        dependency_cache[key] = value
-        dependency_cache[type(value)] = value
+    if kwargs:
+        dependency_cache.update(kwargs)
+        dependency_cache.update({type(value): value for value in kwargs.values()})
     return await solve_dependencies(
         dependent, use_cache=use_cache, stack=stack, dependency_cache=dependency_cache
     )
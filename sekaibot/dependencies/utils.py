@@ -6,6 +6,8 @@
 import inspect
 from collections.abc import AsyncGenerator, Awaitable, Callable, Generator
 from contextlib import AsyncExitStack, asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from enum import IntEnum
 from typing import (  # noqa: UP035
     Any,
     AsyncContextManager,
@@ -15,6 +17,7 @@ from typing import (  # noqa: UP035
     cast,
     get_type_hints,
 )
+from weakref import ReferenceType, WeakKeyDictionary, ref
 
 from sekaibot.utils import get_annotations, sync_ctx_manager_wrapper
 
@@ -42,15 +45,15 @@ class InnerDepends:
         use_cache: 是否使用缓存。默认为 `True`。
     """
 
-    dependency: Dependency | None
-    use_cache: bool
+    __slots__ = ("dependency", "use_cache")
 
     def __init__(self, dependency: Dependency | None = None, *, use_cache: bool = True) -> None:
         if isinstance(dependency, InnerDepends):
-            self.dependency = dependency.dependency
-            self.use_cache = dependency.use_cache
-        self.dependency = dependency
-        self.use_cache = use_cache
+            self.dependency: Dependency | None = dependency.dependency
+            self.use_cache: bool = dependency.use_cache
+        else:
+            self.dependency = dependency
+            self.use_cache = use_cache
 
     def __repr__(self) -> str:
         attr = getattr(self.dependency, "__name__", type(self.dependency).__name__)
@@ -72,66 +75,287 @@ def get_dependency_name(dependency: Dependency[Any]) -> str:
     return dependency.__class__.__name__
 
 
+class DependencyKind(IntEnum):
+    """依赖的类型。"""
+
+    CLASS = 0
+    FUNCTION = 1
+    COROUTINE_FUNCTION = 2
+    ASYNC_GENERATOR = 3
+    GENERATOR = 4
+
+
+class ContextKind(IntEnum):
+    """类依赖实例化后需要进入的上下文类型。"""
+
+    NONE = 0
+    ASYNC = 1
+    SYNC = 2
+
+
+class ParamKind(IntEnum):
+    """函数依赖参数的注入方式。"""
+
+    SUB_DEPENDENCY = 0
+    """参数默认值为子依赖，payload 为 `(子依赖, 是否使用缓存)`"""
+    DEFAULT = 1
+    """参数有普通默认值，payload 为默认值"""
+    LOOKUP = 2
+    """从依赖缓存中按类型注解或参数名查找，payload 为类型注解"""
+
+
+@dataclass(frozen=True, slots=True)
+class DependencyPlan:
+    """依赖的解析计划。
+
+    在依赖第一次被解析时根据其签名构建，并按依赖对象缓存，
+    之后的解析只需遍历计划而无需再次进行反射。
+
+    Attributes:
+        kind: 依赖的类型。
+        params: 函数依赖的参数，元素为 `(参数名, 注入方式, payload)`。
+        members: 类依赖的子依赖成员，元素为 `(属性名, 子依赖, 是否使用缓存)`。
+        context: 类依赖实例化后需要进入的上下文类型。
+    """
+
+    kind: DependencyKind
+    params: tuple[tuple[str, ParamKind, Any], ...] = ()
+    members: tuple[tuple[str, Dependency[Any], bool], ...] = ()
+    context: ContextKind = ContextKind.NONE
+
+
+_PLAN_CACHE: dict[int, tuple[ReferenceType[Any], DependencyPlan]] = {}
+"""类与函数依赖的解析计划缓存，以 `id()` 为键，通过弱引用确认对象仍然存活"""
+_BOUND_PLAN_CACHE: WeakKeyDictionary[Callable[..., Any], DependencyPlan] = WeakKeyDictionary()
+"""绑定方法与可调用实例的解析计划缓存，以其底层函数为键"""
+
+
+def _scan_class_deps(cls: type[Any]) -> list[tuple[str, InnerDepends, Any]]:
+    """沿 MRO 直接遍历各类的 `__dict__`，收集类中声明的子依赖及其类型注解。
+
+    与 `inspect.getmembers()` 不同，此处不会对每个属性调用 `getattr()`，
+    因此不会触发描述符，也不会遍历无关的方法与属性。
+    """
+    deps: dict[str, tuple[InnerDepends, Any]] = {}
+    shadowed: set[str] = set()
+    for klass in cls.__mro__:
+        if klass is object:
+            continue
+        ann = get_annotations(klass)
+        for name, value in vars(klass).items():
+            if name in shadowed:
+                continue
+            shadowed.add(name)
+            if isinstance(value, InnerDepends):
+                deps[name] = (value, ann.get(name))
+    return [(name, sub_dependent, ann) for name, (sub_dependent, ann) in deps.items()]
+
+
+def _build_class_plan(dependent: type[Any]) -> DependencyPlan:
+    members: list[tuple[str, Dependency[Any], bool]] = []
+    for name, sub_dependent, ann in _scan_class_deps(dependent):
+        dependency = sub_dependent.dependency
+        if dependency is None:
+            dependency = ann
+            if dependency is None:
+                raise TypeError(f"can not resolve dependency for attribute '{name}' in {dependent}")
+        members.append((name, dependency, sub_dependent.use_cache))
+
+    if issubclass(dependent, AsyncContextManager):
+        context = ContextKind.ASYNC
+    elif issubclass(dependent, ContextManager):
+        context = ContextKind.SYNC
+    else:
+        context = ContextKind.NONE
+    return DependencyPlan(DependencyKind.CLASS, members=tuple(members), context=context)
+
+
+def _fast_type_hints(func: Callable[..., Any]) -> dict[str, Any]:
+    """获取函数的类型注解。
+
+    注解中不含字符串（前向引用）时直接返回 `__annotations__`，
+    否则回退到 `get_type_hints()` 进行求值。
+    """
+    ann = getattr(func, "__annotations__", None)
+    if ann is not None and not any(isinstance(value, str) for value in ann.values()):
+        return ann
+    return get_type_hints(func)
+
+
+def _fast_params(func: Callable[..., Any]) -> tuple[tuple[str, Any, Any], ...]:
+    """获取函数的参数列表，元素为 `(参数名, 默认值, 原始类型注解)`。
+
+    普通函数直接读取 `__code__`、`__defaults__` 与 `__kwdefaults__`，
+    避免构造 `Signature` 对象；被装饰器包装或含有仅限位置参数的函数
+    回退到 `inspect.signature()`。
+    """
+    code = getattr(func, "__code__", None)
+    if code is None or code.co_posonlyargcount or hasattr(func, "__wrapped__"):
+        return tuple(
+            (param.name, param.default, param.annotation)
+            for param in inspect.signature(func).parameters.values()
+            if param.kind not in (param.VAR_POSITIONAL, param.VAR_KEYWORD)
+        )
+
+    empty = inspect.Parameter.empty
+    ann = func.__annotations__
+    argcount = code.co_argcount
+    names = code.co_varnames[: argcount + code.co_kwonlyargcount]
+    defaults = func.__defaults__ or ()
+    kwdefaults = func.__kwdefaults__ or {}
+    first_default = argcount - len(defaults)
+    return tuple(
+        (
+            name,
+            (defaults[index - first_default] if index >= first_default else empty)
+            if index < argcount
+            else kwdefaults.get(name, empty),
+            ann.get(name, empty),
+        )
+        for index, name in enumerate(names)
+    )
+
+
+def _build_callable_plan(func: Callable[..., Any], *, bound: bool = False) -> DependencyPlan:
+    if inspect.isasyncgenfunction(func):
+        return DependencyPlan(DependencyKind.ASYNC_GENERATOR)
+    if inspect.isgeneratorfunction(func):
+        return DependencyPlan(DependencyKind.GENERATOR)
+    if inspect.iscoroutinefunction(func):
+        kind = DependencyKind.COROUTINE_FUNCTION
+    elif inspect.isfunction(func):
+        kind = DependencyKind.FUNCTION
+    else:
+        raise TypeError(f"Dependent {func} is not a class, function, or generator")
+
+    try:
+        type_hints = _fast_type_hints(func)
+    except NameError:
+        type_hints = None
+    params = _fast_params(func)
+    if bound:
+        # 绑定方法与可调用实例的第一个参数为 `self`，调用时已由 Python 绑定
+        params = params[1:]
+
+    plan_params: list[tuple[str, ParamKind, Any]] = []
+    for name, default, annotation in params:
+        param_type = annotation if type_hints is None else type_hints.get(name)
+        if isinstance(default, InnerDepends):
+            dependency = default.dependency if default.dependency is not None else param_type
+            plan_params.append((name, ParamKind.SUB_DEPENDENCY, (dependency, default.use_cache)))
+        elif default is not inspect.Parameter.empty:
+            plan_params.append((name, ParamKind.DEFAULT, default))
+        else:
+            plan_params.append((name, ParamKind.LOOKUP, param_type))
+    return DependencyPlan(kind, params=tuple(plan_params))
+
+
+def get_dependency_plan(dependent: Dependency[Any]) -> DependencyPlan:
+    """获取依赖的解析计划，若未缓存则构建并缓存。
+
+    Args:
+        dependent: 依赖对象，可能是类、类实例、函数、生成器等。
+
+    Raises:
+        TypeError: `dependent` 无法被解析。
+
+    Returns:
+        依赖的解析计划。
+    """
+    # 类与函数依赖以自身的 id 为键，命中缓存时无需再进行分类，也无需计算哈希
+    entry = _PLAN_CACHE.get(id(dependent))
+    if entry is not None and entry[0]() is dependent:
+        return entry[1]
+
+    if inspect.ismethod(dependent):
+        # type of dependent is a bound method (instance method)
+        key = dependent.__func__
+    elif isinstance(dependent, type) or inspect.isfunction(dependent):
+        plan = (
+            _build_class_plan(dependent)
+            if isinstance(dependent, type)
+            else _build_callable_plan(dependent)
+        )
+        dependent_id = id(dependent)
+        _PLAN_CACHE[dependent_id] = (
+            ref(dependent, lambda _: _PLAN_CACHE.pop(dependent_id, None)),
+            plan,
+        )
+        return plan
+    elif callable(dependent):
+        # type of dependent is an instance with __call__ method (Callable class instance)
+        key = type(dependent).__call__
+        if not inspect.isfunction(key):
+            raise TypeError(
+                f"__call__ method in {dependent.__class__.__name__} is not a valid function"
+            )
+    else:
+        raise TypeError(f"Dependent {dependent} is not a class, function, or generator")
+
+    plan = _BOUND_PLAN_CACHE.get(key)
+    if plan is None:
+        plan = _build_callable_plan(key, bound=True)
+        _BOUND_PLAN_CACHE[key] = plan
+    return plan
+
+
 async def _execute_callable(
     dependent: Callable[..., Any],
-    stack: AsyncExitStack,
+    plan: DependencyPlan,
+    stack: AsyncExitStack | None,
     dependency_cache: dict,
 ) -> Any:
-    """执行可调用对象（函数或 __call__ 方法），并注入参数。"""
-    func_params = inspect.signature(dependent).parameters
+    """按照解析计划执行可调用对象（函数、绑定方法或可调用实例），并注入参数。"""
     func_args = {}
+    name_cache: dict[str, Any] | None = None
 
-    for param_name, param in func_params.items():
-        try:
-            param_type = get_type_hints(dependent).get(param_name)
-        except NameError:
-            param_type = param.annotation
-        if isinstance(param.default, InnerDepends):
+    for param_name, param_kind, payload in plan.params:
+        if param_kind is ParamKind.SUB_DEPENDENCY:
+            sub_dependent, sub_use_cache = payload
             func_args[param_name] = await solve_dependencies(
-                param.default.dependency,
-                use_cache=param.default.use_cache,
+                sub_dependent,
+                use_cache=sub_use_cache,
                 stack=stack,
                 dependency_cache=dependency_cache,
             )
-        elif param.default is not inspect.Parameter.empty:
-            func_args[param_name] = param.default
-        elif param_type in dependency_cache:
-            func_args[param_name] = dependency_cache[param_type]
+        elif param_kind is ParamKind.DEFAULT:
+            func_args[param_name] = payload
+        elif payload in dependency_cache:
+            func_args[param_name] = dependency_cache[payload]
         elif param_name in dependency_cache:
             func_args[param_name] = dependency_cache[param_name]
         else:
-            name_cache = {get_dependency_name(_cache): _cache for _cache in dependency_cache.keys()}
-            if isinstance(param_type, str) and param_type in name_cache:
-                func_args[param_name] = dependency_cache[name_cache[param_type]]
+            if name_cache is None:
+                name_cache = {
+                    get_dependency_name(_cache): _cache for _cache in dependency_cache.keys()
+                }
+            if isinstance(payload, str) and payload in name_cache:
+                func_args[param_name] = dependency_cache[name_cache[payload]]
             elif param_name in name_cache:
                 func_args[param_name] = dependency_cache[name_cache[param_name]]
             else:
                 raise TypeError(
-                    f"Cannot resolve parameter '{param_name}' for dependency '{dependent.__name__}'"
+                    f"Cannot resolve parameter '{param_name}' for dependency "
+                    f"'{get_dependency_name(dependent)}'"
                 )
 
-    if inspect.iscoroutinefunction(dependent):
+    if plan.kind is DependencyKind.COROUTINE_FUNCTION:
         return await dependent(**func_args)
     return dependent(**func_args)
 
 
 async def _execute_class(
-    dependent: Callable[..., Any],
-    stack: AsyncExitStack,
+    dependent: type[Any],
+    plan: DependencyPlan,
+    stack: AsyncExitStack | None,
     dependency_cache: dict,
 ) -> Any:
+    """按照解析计划实例化类依赖，并注入子依赖成员。"""
     values: dict[str, Any] = {}
-    ann = get_annotations(dependent)
-    for name, sub_dependent in inspect.getmembers(dependent, lambda x: isinstance(x, InnerDepends)):
-        assert isinstance(sub_dependent, InnerDepends)
-        if sub_dependent.dependency is None:
-            dependent_ann = ann.get(name)
-            if dependent_ann is None:
-                raise TypeError(f"can not resolve dependency for attribute '{name}' in {dependent}")
-            sub_dependent.dependency = dependent_ann
+    for name, sub_dependent, sub_use_cache in plan.members:
         values[name] = await solve_dependencies(
-            sub_dependent.dependency,
-            use_cache=sub_dependent.use_cache,
+            sub_dependent,
+            use_cache=sub_use_cache,
             stack=stack,
             dependency_cache=dependency_cache,
         )
@@ -143,11 +367,11 @@ async def _execute_class(
         setattr(depend_obj, key, value)
     depend_obj.__init__()
 
-    if isinstance(depend_obj, AsyncContextManager):
+    if plan.context is ContextKind.ASYNC:
         if stack is None:
             raise TypeError("stack cannot be None when entering an async context")
         depend = await stack.enter_async_context(depend_obj)  # pyright: ignore
-    elif isinstance(depend_obj, ContextManager):
+    elif plan.context is ContextKind.SYNC:
         if stack is None:
             raise TypeError("stack cannot be None when entering a sync context")
         depend = await stack.enter_async_context(  # pyright: ignore
@@ -190,42 +414,34 @@ async def solve_dependencies(
     if use_cache and dependent in dependency_cache:
         return dependency_cache[dependent]
 
-    if isinstance(dependent, type):
+    if isinstance(dependent, str):
+        name_cache = {get_dependency_name(_cache): _cache for _cache in dependency_cache.keys()}
+        if dependent not in name_cache:
+            raise TypeError(f"Cannot resolve dependency named '{dependent}'")
+        depend = dependency_cache[name_cache[dependent]]
+        dependency_cache[dependent] = depend
+        return depend
+
+    plan = get_dependency_plan(dependent)
+    kind = plan.kind
+    if kind is DependencyKind.CLASS:
         # type of dependent is Type[T] (Class, not instance)
-        depend = await _execute_class(dependent, stack, dependency_cache)
-    elif inspect.iscoroutinefunction(dependent) or inspect.isfunction(dependent):
+        depend = await _execute_class(dependent, plan, stack, dependency_cache)
+    elif kind is DependencyKind.FUNCTION or kind is DependencyKind.COROUTINE_FUNCTION:
         # type of dependent is Callable[..., T] | Callable[..., Awaitable[T]]
-        depend = await _execute_callable(dependent, stack, dependency_cache)
-    elif inspect.isasyncgenfunction(dependent):
+        depend = await _execute_callable(dependent, plan, stack, dependency_cache)
+    elif kind is DependencyKind.ASYNC_GENERATOR:
         # type of dependent is Callable[[], AsyncGenerator[T, None]]
         if stack is None:
             raise TypeError("stack cannot be None when entering an async generator context")
         cm = asynccontextmanager(dependent)()
         depend = cast(_T, await stack.enter_async_context(cm))
-    elif inspect.isgeneratorfunction(dependent):
+    else:
         # type of dependent is Callable[[], Generator[T, None, None]]
         if stack is None:
             raise TypeError("stack cannot be None when entering a generator context")
         cm = sync_ctx_manager_wrapper(contextmanager(dependent)())
         depend = cast(_T, await stack.enter_async_context(cm))
-    elif inspect.ismethod(dependent):
-        # type of dependent is a bound method (instance method)
-        depend = await _execute_callable(dependent.__func__, stack, dependency_cache)
-    elif isinstance(dependent, object) and callable(dependent):
-        # type of dependent is an instance with __call__ method (Callable class instance)
-        call_method = dependent.__call__
-        if inspect.iscoroutinefunction(call_method) or inspect.isfunction(call_method):
-            depend = await _execute_callable(call_method, stack, dependency_cache)
-        else:
-            raise TypeError(
-                f"__call__ method in {dependent.__class__.__name__} is not a valid function"
-            )
-    elif isinstance(dependent, str):
-        name_cache = {get_dependency_name(_cache): _cache for _cache in dependency_cache.keys()}
-        if dependent in name_cache:
-            depend = dependency_cache[name_cache[dependent]]
-    else:
-        raise TypeError(f"Dependent {dependent} is not a class, function, or generator")
 
     dependency_cache[dependent] = depend
     return depend  # pyright: ignore
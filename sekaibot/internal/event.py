@@ -6,7 +6,7 @@
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any, Generic, NamedTuple, override
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from sekaibot.typing import AdapterT
 
@@ -29,6 +29,19 @@ class Event(ABC, BaseModel, Generic[AdapterT]):
     type: str | None
     __handled__: bool = False
 
+    _plain_text: str | None = PrivateAttr(default=None)
+    """`get_plain_text()` 结果的缓存，供同一事件的多个规则复用"""
+    _folded_text: str | None = PrivateAttr(default=None)
+    """忽略大小写后的消息纯文本缓存"""
+    _message_text: str | None = PrivateAttr(default=None)
+    """`str(get_message())` 结果的缓存"""
+    _folded_message_text: str | None = PrivateAttr(default=None)
+    """忽略大小写后的消息文本缓存"""
+    _command_prefix: tuple[Any, Any] | None = PrivateAttr(default=None)
+    """命令前缀匹配结果的缓存，为 `(前缀树, 匹配结果)`"""
+    _tome: bool | None = PrivateAttr(default=None)
+    """`is_tome()` 结果的缓存"""
+
     if TYPE_CHECKING:
         adapter: AdapterT
     else:
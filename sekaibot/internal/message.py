@@ -20,6 +20,8 @@ from typing import (  # noqa: UP035
 from pydantic import BaseModel, Field, GetCoreSchemaHandler
 from pydantic_core import core_schema
 
+from sekaibot.utils import fold_case
+
 __all__ = [
     "MessageT",
     "MessageSegmentT",
@@ -270,19 +272,19 @@ class Message(ABC, list[MessageSegmentT]):
         if not prefix:
             return default if return_key else False
         if isinstance(prefix, str):
-            text = str(self).casefold() if ignorecase else str(self)
-            prefix = prefix.casefold() if ignorecase else prefix
+            text = fold_case(str(self)) if ignorecase else str(self)
+            prefix = fold_case(prefix) if ignorecase else prefix
             if text.startswith(prefix, start, end):
                 return prefix if return_key else True
         elif isinstance(prefix, self.get_segment_class()):
             if len(self) != 0 and self[0] == prefix:
                 return prefix if return_key else True
         elif isinstance(prefix, tuple):
-            text = str(self).casefold() if ignorecase else str(self)
+            text = fold_case(str(self)) if ignorecase else str(self)
             first = self[0] if self else None
             for item in prefix:
                 if isinstance(item, str):
-                    p = item.casefold() if ignorecase else item
+                    p = fold_case(item) if ignorecase else item
                     if text.startswith(p, start, end):
                         return item if return_key else True
                 elif isinstance(item, self.get_segment_class()):
@@ -344,19 +346,19 @@ class Message(ABC, list[MessageSegmentT]):
         if not suffix:
             return default if return_key else False
         if isinstance(suffix, str):
-            text = str(self).casefold() if ignorecase else str(self)
-            suffix = suffix.casefold() if ignorecase else suffix
+            text = fold_case(str(self)) if ignorecase else str(self)
+            suffix = fold_case(suffix) if ignorecase else suffix
             if text.endswith(suffix, start, end):
                 return suffix if return_key else True
         elif isinstance(suffix, self.get_segment_class()):
             if len(self) != 0 and self[-1] == suffix:
                 return suffix if return_key else True
         elif isinstance(suffix, tuple):
-            text = str(self).casefold() if ignorecase else str(self)
+            text = fold_case(str(self)) if ignorecase else str(self)
             last = self[-1] if self else None
             for item in suffix:
                 if isinstance(item, str):
-                    s = item.casefold() if ignorecase else item
+                    s = fold_case(item) if ignorecase else item
                     if text.endswith(s, start, end):
                         return item if return_key else True
                 elif isinstance(item, self.get_segment_class()):
@@ -1,4 +1,5 @@
-import time
+import logging
+import math
 from collections import defaultdict
 from collections.abc import Awaitable, Callable
 from contextlib import AsyncExitStack
@@ -6,12 +7,13 @@ from functools import partial
 from typing import TYPE_CHECKING, Any, overload
 
 import anyio
-from anyio.abc import TaskStatus
+from anyio.abc import TaskGroup
 from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
 from exceptiongroup import BaseExceptionGroup, catch
 
 from sekaibot.consts import JUMO_TO_TARGET, MAX_TIMEOUT
-from sekaibot.dependencies import solve_dependencies_in_bot
+from sekaibot.dependencies import seed_dependency_cache, solve_dependencies_in_bot
+from sekaibot.dependencies.utils import ContextKind, get_dependency_plan
 from sekaibot.exceptions import (
     GetEventTimeout,
     IgnoreException,
@@ -30,22 +32,195 @@ from sekaibot.utils import cancel_on_exit, handle_exception, run_coro_with_catch
 if TYPE_CHECKING:
     from sekaibot.bot import Bot
 
+_BASE_NODE_MEMBERS: frozenset[tuple[str, Any, bool]] | None = None
+"""`Node` 基类声明的子依赖成员"""
+
+
+def _set_handled(event: Event[Any], handled: bool) -> None:
+    """设置事件的 `__handled__` 标记。
+
+    `__handled__` 并非模型字段，直接写入实例字典即可，无需经过 `BaseModel.__setattr__`。
+    """
+    object.__setattr__(event, "__handled__", handled)
+
+
+def _is_plain_node(node_class: type[Node]) -> bool:
+    """判断节点是否只使用 `Node` 基类声明的子依赖，此时可直接实例化而无需解析依赖。"""
+    global _BASE_NODE_MEMBERS
+    if _BASE_NODE_MEMBERS is None:
+        _BASE_NODE_MEMBERS = frozenset(get_dependency_plan(Node).members)
+    plan = get_dependency_plan(node_class)
+    return plan.context is ContextKind.NONE and _BASE_NODE_MEMBERS.issuperset(plan.members)
+
+
+_NodeInstantiator = Callable[
+    [Event[Any], StateT, AsyncExitStack | None, DependencyCacheT | None], Awaitable[Node]
+]
+"""节点实例化函数，接受当前事件、状态、异步上下文栈和依赖缓存"""
+
+
+class _GetWaiter:
+    """一个正在等待事件的 `get()` 调用。
+
+    Attributes:
+        func: 判断事件是否满足条件的异步函数。
+        max_try_times: 最大事件数。
+        try_times: 已检查过的事件数。
+        wakeup: 等待结束时设置，由事件分发流程或 `get()` 自身设置。
+        event: 捕获到的事件，未捕获时为 `None`。
+        exc: 条件函数抛出的异常，将在 `get()` 中重新抛出。
+    """
+
+    __slots__ = ("event", "exc", "func", "max_try_times", "try_times", "wakeup")
+
+    func: Callable[[Event[Any]], Awaitable[bool]]
+    max_try_times: int | None
+    try_times: int
+    wakeup: anyio.Event
+    event: Event[Any] | None
+    exc: Exception | None
+
+    def __init__(
+        self, func: Callable[[Event[Any]], Awaitable[bool]], max_try_times: int | None
+    ) -> None:
+        self.func = func
+        self.max_try_times = max_try_times
+        self.try_times = 0
+        self.wakeup = anyio.Event()
+        self.event = None
+        self.exc = None
+
 
 class NodeManager:
     bot: "Bot"
 
-    _condition: anyio.Condition
     _cancel_event: anyio.Event
-    _current_event: Event[Adapter[Any, Any]] | None
+    _get_waiters: list[_GetWaiter]
 
     _event_send_stream: MemoryObjectSendStream[EventHandleOption]  # pyright: ignore[reportUninitializedInstanceVariable]
     _event_receive_stream: MemoryObjectReceiveStream[EventHandleOption]  # pyright: ignore[reportUninitializedInstanceVariable]
 
+    _worker_send_stream: MemoryObjectSendStream[Event[Any]] | None
+
+    _nodes_source: list[tuple[type[Node], int]] | None
+    _nodes_snapshot: tuple[tuple[type[Node], int], ...]
+    _node_index: dict[str, int]
+    _node_candidates: dict[type[Event[Any]], tuple[int, ...]]
+    _node_instantiators: dict[type[Node], _NodeInstantiator]
+
+    _debug_enabled: bool
+    """是否输出 DEBUG 日志，在启动时根据日志配置确定，用于跳过热路径上的日志调用"""
+
     def __init__(self, bot: "Bot"):
         self.bot = bot
+        self._debug_enabled = True
+        self._get_waiters = []
+        self._worker_send_stream = None
+        self._nodes_source = None
+        self._nodes_snapshot = ()
+        self._node_index = {}
+        self._node_candidates = {}
+        self._node_instantiators = {}
+
+    def _get_nodes(self) -> tuple[tuple[tuple[type[Node], int], ...], dict[str, int]]:
+        """获取节点列表的快照及节点名称到下标的映射。
+
+        节点重载时 `bot.nodes_list` 会被替换或清空，只有此时才重新生成快照和映射。
+        """
+        nodes_list = self.bot.nodes_list
+        if nodes_list is not self._nodes_source or len(nodes_list) != len(self._nodes_snapshot):
+            self._nodes_source = nodes_list
+            self._nodes_snapshot = tuple(nodes_list)
+            self._node_index = {
+                node.__name__: i for i, (node, _) in enumerate(self._nodes_snapshot)
+            }
+            self._node_candidates = {}
+            self._node_instantiators = {}
+        return self._nodes_snapshot, self._node_index
+
+    def _get_node_candidates(self, event_class: type[Event[Any]]) -> tuple[int, ...]:
+        """获取指定事件类在节点列表快照中的候选下标表，须在 `_get_nodes()` 之后调用。
+
+        返回值的第 `i` 项为从 `i` 开始遍历时首个可能匹配该事件类的节点下标，最后一项为节点数量。
+        `EventType` 为事件类的节点仅凭事件的类即可排除，其余节点均视为候选。
+        被排除的节点按检查未通过处理：非 `block` 节点剪枝，其子节点一并跳过；
+        `block` 节点只跳过自身，其子节点仍会被检查。
+        因此遍历节点时可以直接跳过不可能匹配的节点，而不改变节点的顺序及下标。
+        """
+        candidates = self._node_candidates.get(event_class)
+        if candidates is None:
+            nodes_count = len(self._nodes_snapshot)
+            next_candidates = [nodes_count] * (nodes_count + 1)
+            for i in range(nodes_count - 1, -1, -1):
+                node_class, pruning_node = self._nodes_snapshot[i]
+                node_event_class = node_class.__node_event_class__
+                if node_event_class is None or issubclass(event_class, node_event_class):
+                    next_candidates[i] = i
+                elif node_class.block:
+                    # 检查未通过的 block 节点不剪枝，继续检查下一个节点
+                    next_candidates[i] = next_candidates[i + 1]
+                elif pruning_node != -1:
+                    # 剪枝后跳转索引总在当前节点之后，此时已计算完毕
+                    next_candidates[i] = next_candidates[pruning_node]
+            candidates = self._node_candidates[event_class] = tuple(next_candidates)
+        return candidates
+
+    def _get_node_instantiator(self, node_class: type[Node]) -> _NodeInstantiator:
+        """获取节点的实例化函数，节点列表重建前只生成一次。
+
+        是否可以跳过依赖注入、节点名称和配置类等只与节点类有关的信息在生成时确定，
+        实例化时只需传入与当前事件有关的参数。
+        """
+        instantiator = self._node_instantiators.get(node_class)
+        if instantiator is not None:
+            return instantiator
+
+        bot = self.bot
+        class_name = node_class.__name__
+        config_class = getattr(node_class, "Config", None)
+
+        if _is_plain_node(node_class):
+
+            async def instantiator(
+                current_event: Event[Any],
+                state: StateT,
+                stack: AsyncExitStack | None,
+                dependency_cache: DependencyCacheT | None,
+            ) -> Node:
+                # 与依赖注入的结果相同，但省去了逐个解析子依赖的开销
+                _node = node_class.__new__(node_class)
+                _node.event = current_event
+                _node.state = state
+                _node._name = class_name
+                _node._config = config_class
+                _node.__init__()
+                return _node
+
+        else:
+
+            async def instantiator(
+                current_event: Event[Any],
+                state: StateT,
+                stack: AsyncExitStack | None,
+                dependency_cache: DependencyCacheT | None,
+            ) -> Node:
+                return await solve_dependencies_in_bot(
+                    node_class,
+                    bot=bot,
+                    event=current_event,
+                    state=state,
+                    node_state=bot.node_state.get(class_name),
+                    global_state=bot.global_state,
+                    use_cache=True,
+                    stack=stack,
+                    dependency_cache=dependency_cache,
+                )
+
+        self._node_instantiators[node_class] = instantiator
+        return instantiator
 
     async def startup(self) -> None:
-        self._condition = anyio.Condition()
+        self._debug_enabled = logger.is_enabled_for(logging.DEBUG)
         self._cancel_event = anyio.Event()
         self._event_send_stream, self._event_receive_stream = anyio.create_memory_object_stream(
             max_buffer_size=self.bot.config.bot.event_queue_size
@@ -263,33 +438,91 @@ class NodeManager:
                 current_event=current_event,
             )
 
-        await self._event_send_stream.send(
-            EventHandleOption(
-                event=current_event,
-                handle_get=handle_get,
-            )
-        )
+        option = EventHandleOption(event=current_event, handle_get=handle_get)
+        try:
+            # 缓冲区未满时直接写入，避免每个事件都经过一次异步等待
+            self._event_send_stream.send_nowait(option)
+        except anyio.WouldBlock:
+            await self._event_send_stream.send(option)
 
     async def _handle_event_receive(self) -> None:
         async with anyio.create_task_group() as tg, self._event_receive_stream:
-            async for current_event, handle_get in self._event_receive_stream:
-                if handle_get:
-                    await tg.start(self._handle_event_wait_condition)
-                    async with self._condition:
-                        self._current_event = current_event
-                        self._condition.notify_all()
-                else:
-                    tg.start_soon(self._handle_event, current_event)
-
-    async def _handle_event_wait_condition(
-        self, *, task_status: TaskStatus[None] = anyio.TASK_STATUS_IGNORED
+            if workers := self.bot.config.bot.event_workers:
+                # 使用固定数量的常驻任务处理事件，而不是为每个事件创建新任务
+                self._worker_send_stream, worker_receive_stream = (
+                    anyio.create_memory_object_stream()
+                )
+                async with worker_receive_stream:
+                    for _ in range(workers):
+                        tg.start_soon(self._run_event_worker, worker_receive_stream.clone())
+            try:
+                async for option in self._event_receive_stream:
+                    await self._dispatch_event_option(option, tg)
+                    # 一次取出缓冲区中已积压的全部事件，而不是每个事件都等待一次
+                    while True:
+                        try:
+                            option = self._event_receive_stream.receive_nowait()
+                        except (anyio.WouldBlock, anyio.EndOfStream):
+                            break
+                        await self._dispatch_event_option(option, tg)
+            finally:
+                if self._worker_send_stream is not None:
+                    self._worker_send_stream.close()
+                    self._worker_send_stream = None
+
+    async def _run_event_worker(
+        self, receive_stream: MemoryObjectReceiveStream[Event[Any]]
     ) -> None:
-        async with self._condition:
-            task_status.started()
-            await self._condition.wait()
-            assert self._current_event is not None
-            current_event = self._current_event
-        await self._handle_event(current_event)
+        """常驻的事件处理任务，依次处理分配到的事件。"""
+        async with receive_stream:
+            async for current_event in receive_stream:
+                await self._handle_event(current_event)
+
+    async def _dispatch_event_option(self, option: EventHandleOption, tg: TaskGroup) -> None:
+        """将接收到的事件交给对应的处理流程。"""
+        current_event, handle_get = option
+        if handle_get and self._get_waiters:
+            await self._notify_get_waiters(current_event)
+            if current_event.__handled__:
+                return
+        if self._worker_send_stream is not None:
+            try:
+                self._worker_send_stream.send_nowait(current_event)
+            except anyio.WouldBlock:
+                # 常驻任务全部繁忙时（例如都在 `get()` 中等待后续事件）不能阻塞接收循环，
+                # 否则等待者需要的事件永远无法送达，因此直接创建新任务处理
+                tg.start_soon(self._handle_event, current_event)
+        else:
+            tg.start_soon(self._handle_event, current_event)
+
+    async def _notify_get_waiters(self, current_event: Event[Any]) -> None:
+        """依次检查正在等待的 `get()`，只唤醒第一个满足条件的等待者及超过最大事件数的等待者。"""
+        for waiter in tuple(self._get_waiters):
+            if not current_event.__handled__:
+                try:
+                    matched = await waiter.func(current_event)
+                except Exception as exc:
+                    waiter.exc = exc
+                    self._wake_get_waiter(waiter)
+                    continue
+                # 检查期间等待者可能已经超时退出
+                if waiter.wakeup.is_set():
+                    continue
+                if matched:
+                    _set_handled(current_event, True)
+                    waiter.event = current_event
+                    self._wake_get_waiter(waiter)
+                    continue
+
+            waiter.try_times += 1
+            if waiter.max_try_times is not None and waiter.try_times > waiter.max_try_times:
+                self._wake_get_waiter(waiter)
+
+    def _wake_get_waiter(self, waiter: _GetWaiter) -> None:
+        """将等待者移出等待列表并唤醒。"""
+        if not waiter.wakeup.is_set():
+            self._get_waiters.remove(waiter)
+            waiter.wakeup.set()
 
     async def _add_temporary_task(
         self,
@@ -308,10 +541,14 @@ class NodeManager:
         """
 
         async def temporary_task(func: Callable[[Event], bool | Awaitable[bool]] | None = None):
+            # 条件函数和会话 ID 只需准备一次，无需在每个事件到来时重复计算
+            _func = wrap_get_func(func)
+            session_id = current_event.get_session_id()
+
             async def check(event: Event[Any]) -> bool:
-                if event.get_session_id() != current_event.get_session_id():
+                if event.get_session_id() != session_id:
                     return False
-                return await wrap_get_func(func)(event)
+                return await _func(event)
 
             try:
                 event = await self.get(
@@ -321,7 +558,7 @@ class NodeManager:
                     timeout=timeout,
                 )
                 event_copy = event.model_copy()
-                event_copy.__handled__ = False
+                _set_handled(event_copy, False)
                 await self._handle_event(event_copy, state, node_class)
             except GetEventTimeout:
                 return
@@ -336,6 +573,7 @@ class NodeManager:
         state: StateT,
         stack: AsyncExitStack | None = None,
         dependency_cache: DependencyCacheT | None = None,
+        permission_cache: dict[tuple[Any, ...], bool] | None = None,
     ) -> bool:
         """检查事件响应器是否符合运行条件。
 
@@ -348,23 +586,36 @@ class NodeManager:
             state: 会话状态
             stack: 异步上下文栈
             dependency_cache: 依赖缓存
+            permission_cache: 本次事件分发中的权限检查结果缓存
 
         返回:
             bool: 是否符合运行条件
         """
 
+        node_name = node_class.__name__
+        if not node_class._matches_event(current_event):
+            if self._debug_enabled:
+                logger.debug("event type not matched", node=node_name)
+            return False
+
         passed = True
 
         def handle_check_exception(msg: str, exc_group: BaseExceptionGroup[Exception]) -> None:
             nonlocal passed
-            handle_exception(msg, node=node_class.__name__)(exc_group)
+            handle_exception(msg, node=node_name)(exc_group)
             passed = False
 
         with catch({Exception: partial(handle_check_exception, "permission check failed")}):
             if not await node_class._check_perm(
-                self.bot, current_event, self.bot.global_state, stack, dependency_cache
+                self.bot,
+                current_event,
+                self.bot.global_state,
+                stack,
+                dependency_cache,
+                permission_cache,
             ):
-                logger.debug("permission conditions not met", node=node_class.__name__)
+                if self._debug_enabled:
+                    logger.debug("permission conditions not met", node=node_name)
                 return False
 
         if not passed:
@@ -374,7 +625,8 @@ class NodeManager:
             if not await node_class._check_rule(
                 self.bot, current_event, state, self.bot.global_state, stack, dependency_cache
             ):
-                logger.debug("rule conditions not met", node=node_class.__name__)
+                if self._debug_enabled:
+                    logger.debug("rule conditions not met", node=node_name)
                 return False
 
         return passed
@@ -387,24 +639,18 @@ class NodeManager:
         stack: AsyncExitStack | None = None,
         dependency_cache: DependencyCacheT | None = None,
     ) -> tuple[PruningException | JumpToException | None, StateT]:
-        _node = await solve_dependencies_in_bot(
-            node_class,
-            bot=self.bot,
-            event=current_event,
-            state=state,
-            node_state=self.bot.node_state.get(node_class.__name__),
-            global_state=self.bot.global_state,
-            use_cache=True,
-            stack=stack,
-            dependency_cache=dependency_cache,
+        _node = await self._get_node_instantiator(node_class)(
+            current_event, state, stack, dependency_cache
         )
 
-        if _node.name not in self.bot.node_state:
-            state = _node.__init_state__()
-            if state is not None:
-                self.bot.node_state[_node.name] = state
+        node_name = _node.name
+        if node_name not in self.bot.node_state:
+            node_state = _node.__init_state__()
+            if node_state is not None:
+                self.bot.node_state[node_name] = node_state
 
-        if not await self._run_node_preprocessors(
+        # 没有注册钩子时直接跳过，避免每个节点都创建一次协程
+        if self.bot._node_preprocessor_hooks and not await self._run_node_preprocessors(
             current_event=current_event,
             state=state,
             node=_node,
@@ -415,13 +661,14 @@ class NodeManager:
 
         exception = await _node._run_node()
 
-        await self._run_node_postprocessors(
-            current_event=current_event,
-            node=_node,
-            exception=exception,
-            stack=stack,
-            dependency_cache=dependency_cache,
-        )
+        if self.bot._node_postprocessor_hooks:
+            await self._run_node_postprocessors(
+                current_event=current_event,
+                node=_node,
+                exception=exception,
+                stack=stack,
+                dependency_cache=dependency_cache,
+            )
         return exception, _node.state
 
     async def _check_and_run_node(
@@ -431,8 +678,11 @@ class NodeManager:
         state: StateT,
         stack: AsyncExitStack | None,
         dependency_cache: DependencyCacheT | None = None,
+        permission_cache: dict[tuple[Any, ...], bool] | None = None,
     ) -> tuple[PruningException | JumpToException | None, StateT | None]:
-        if not await self._check_node(node_class, current_event, state, stack, dependency_cache):
+        if not await self._check_node(
+            node_class, current_event, state, stack, dependency_cache, permission_cache
+        ):
             return StopException() if node_class.block else PruningException(), None
 
         return await self._run_node(node_class, current_event, state, stack, dependency_cache)
@@ -455,9 +705,11 @@ class NodeManager:
             return
 
         async with AsyncExitStack() as stack:
-            dependency_cache = {}
+            dependency_cache = seed_dependency_cache(
+                {}, bot=self.bot, event=current_event, global_state=self.bot.global_state
+            )
 
-            if not await self._run_event_preprocessors(
+            if self.bot._event_preprocessor_hooks and not await self._run_event_preprocessors(
                 current_event=current_event,
                 state=state,
                 stack=stack,
@@ -465,42 +717,49 @@ class NodeManager:
             ):
                 return
 
-            nodes_list = self.bot.nodes_list.copy()
+            nodes_list, jump_to_index_map = self._get_nodes()
+            permission_cache: dict[tuple[Any, ...], bool] = {}
             state = state or defaultdict(lambda: None)
-            jump_to_index_map = {node.__name__: i for i, (node, _) in enumerate(nodes_list)}
-            index = jump_to_index_map.get(start_class.__name__, 0) if start_class else 0
+            # 跳过 EventType 与当前事件的类不匹配的节点
+            node_candidates = self._get_node_candidates(type(current_event))
+            index = node_candidates[
+                jump_to_index_map.get(start_class.__name__, 0) if start_class else 0
+            ]
+            # 热循环中频繁访问的属性绑定为局部变量
+            nodes_count = len(nodes_list)
+            check_and_run_node = self._check_and_run_node
+            node_state = state.copy
             interrupted = False
 
-            def _handle_stop_propagation(exc_group: BaseExceptionGroup) -> None:
-                nonlocal interrupted
-                interrupted = True
-                logger.debug("Stop event propagation")
-
-            while index < len(nodes_list) and not interrupted:
+            while index < nodes_count and not interrupted:
                 node_class, pruning_node = nodes_list[index]
 
-                logger.debug("Checking for matching nodes", priority=node_class)
+                if self._debug_enabled:
+                    logger.debug("Checking for matching nodes", priority=node_class)
 
                 next_index = index + 1
 
-                with catch(
-                    {
-                        StopException: _handle_stop_propagation,
-                        Exception: handle_exception("Error when running Node.", node=node_class),
-                    }
-                ):
-                    exc, _state = await self._check_and_run_node(
+                try:
+                    # 每个节点使用独立的依赖缓存，复制后修正自引用即可，无需重新写入上下文
+                    node_dependency_cache = dependency_cache.copy()
+                    node_dependency_cache[DependencyCacheT] = node_dependency_cache
+                    node_dependency_cache[NameT] = node_class.__name__
+                    node_dependency_cache[ConfigT] = getattr(node_class, "Config", None)
+                    exc, _state = await check_and_run_node(
                         node_class,
                         current_event,
-                        state.copy(),
+                        node_state(),
                         stack,
-                        dependency_cache
-                        | {
-                            NameT: node_class.__name__,
-                            ConfigT: getattr(node_class, "Config", None),
-                        },
+                        node_dependency_cache,
+                        permission_cache,
                     )
-
+                except* StopException:
+                    interrupted = True
+                    if self._debug_enabled:
+                        logger.debug("Stop event propagation")
+                except* Exception as exc_group:
+                    handle_exception("Error when running Node.", node=node_class)(exc_group)
+                else:
                     if isinstance(exc, PruningException):
                         if pruning_node == -1:
                             break
@@ -527,16 +786,18 @@ class NodeManager:
                                 node=node_class,
                             )
 
-                index = next_index
+                index = node_candidates[next_index]
 
-            logger.debug("Checking for nodes completed")
+            if self._debug_enabled:
+                logger.debug("Checking for nodes completed")
 
-            await self._run_event_postprocessors(
-                current_event=current_event,
-                state=state,
-                stack=stack,
-                dependency_cache=dependency_cache,
-            )
+            if self.bot._event_postprocessor_hooks:
+                await self._run_event_postprocessors(
+                    current_event=current_event,
+                    state=state,
+                    stack=stack,
+                    dependency_cache=dependency_cache,
+                )
 
         logger.info("Event Finished")
 
@@ -606,35 +867,25 @@ class NodeManager:
         Raises:
             GetEventTimeout: 超过最大事件数或超时。
         """
-        _func = wrap_get_func(func, event_type=event_type, adapter_type=adapter_type)
-
-        try_times = 0
-        start_time = time.time()
-        while not self.bot._should_exit.is_set():
-            if max_try_times is not None and try_times > max_try_times:
-                break
-            if timeout is not None and time.time() - start_time > timeout:
-                break
-
-            async with self._condition:
-                if timeout is None:
-                    await self._condition.wait()
-                else:
-                    try:
-                        with anyio.fail_after(start_time + timeout - time.time()):
-                            await self._condition.wait()
-                    except TimeoutError:
-                        break
-
-                if (
-                    self._current_event is not None
-                    and not self._current_event.__handled__
-                    and await _func(self._current_event)
-                ):
-                    self._current_event.__handled__ = True
-                    logger.debug("Event caught", event=self._current_event)
-                    return self._current_event
-
-                try_times += 1
+        if self.bot._should_exit.is_set():
+            raise GetEventTimeout
+
+        # 每个 get() 拥有独立的等待者，事件到来时只有满足条件的等待者会被唤醒
+        waiter = _GetWaiter(
+            wrap_get_func(func, event_type=event_type, adapter_type=adapter_type), max_try_times
+        )
+        self._get_waiters.append(waiter)
+        deadline = math.inf if timeout is None else anyio.current_time() + timeout
+        try:
+            with anyio.CancelScope(deadline=deadline):
+                await waiter.wakeup.wait()
+        finally:
+            self._wake_get_waiter(waiter)
+
+        if waiter.exc is not None:
+            raise waiter.exc
+        if waiter.event is not None:
+            logger.debug("Event caught", current_event=waiter.event)
+            return waiter.event
 
         raise GetEventTimeout
@@ -4,8 +4,10 @@
 """
 
 import inspect
+from collections.abc import Callable
 from contextlib import AsyncExitStack
 from enum import Enum
+from functools import cached_property, lru_cache
 from types import UnionType
 from typing import (
     TYPE_CHECKING,
@@ -15,18 +17,17 @@ from typing import (
     Generic,
     NoReturn,
     TypeVar,
-    cast,
     final,
     get_args,
     get_origin,
 )
 
 import anyio
-from exceptiongroup import BaseExceptionGroup, catch
 
 from sekaibot.config import ConfigModel
 from sekaibot.consts import JUMO_TO_TARGET, MAX_TIMEOUT, REJECT_TARGET
 from sekaibot.dependencies import _T, Dependency, Depends, solve_dependencies_in_bot
+from sekaibot.dependencies.utils import DependencyKind, ParamKind, get_dependency_plan
 from sekaibot.exceptions import (
     FinishException,
     JumpToException,
@@ -49,7 +50,7 @@ from sekaibot.typing import (
     NodeStateT,
     StateT,
 )
-from sekaibot.utils import flatten_exception_group, handle_exception, is_config_class
+from sekaibot.utils import flatten_exception_group, is_config_class
 
 if TYPE_CHECKING:
     from sekaibot.bot import Bot
@@ -66,6 +67,127 @@ class NodeLoadType(Enum):
     CLASS = "class"
 
 
+_NODE_BASE_CACHE: dict[Any, tuple[Any, Any, Any] | None] = {}
+"""节点泛型基类的解析结果缓存"""
+
+
+def _parse_node_base(orig_base: Any) -> tuple[Any, Any, Any] | None:
+    """解析节点的泛型基类，结果会被缓存。
+
+    Returns:
+        `(事件类型, 状态类型, 配置类)`，事件类型与配置类不合法时为 `None`；
+        不是 `Node` 的泛型基类时返回 `None`。
+    """
+    try:
+        return _NODE_BASE_CACHE[orig_base]
+    except KeyError:
+        cacheable = True
+    except TypeError:  # 泛型参数不可哈希时不缓存
+        cacheable = False
+
+    parsed = None
+    origin_class = get_origin(orig_base)
+    if inspect.isclass(origin_class) and issubclass(origin_class, Node):
+        args = get_args(orig_base)
+        if len(args) == 3:
+            event_t, state_t, config_t = args
+            if not (
+                inspect.isclass(event_t)
+                and issubclass(event_t, Event)
+                or isinstance(event_t, UnionType)
+            ):
+                event_t = None
+            if not (inspect.isclass(config_t) and issubclass(config_t, ConfigModel)):
+                config_t = None
+            parsed = (event_t, state_t, config_t)
+
+    if cacheable:
+        _NODE_BASE_CACHE[orig_base] = parsed
+    return parsed
+
+
+def _always_true(_event: Event[Any]) -> bool:
+    return True
+
+
+def _get_event_class(
+    event_type: str | type[Event] | UnionType,
+) -> type[Event] | UnionType | None:
+    """若 `EventType` 为事件类或其联合类型则返回它，否则返回 `None`。"""
+    if (
+        inspect.isclass(event_type)
+        and issubclass(event_type, Event)
+        or isinstance(event_type, UnionType)
+    ):
+        return event_type
+    return None
+
+
+def _build_event_checker(event_type: str | type[Event] | UnionType) -> Callable[[Event[Any]], bool]:
+    """根据节点的 `EventType` 预先生成事件类型判断函数。"""
+    if event_type == "":
+        return _always_true
+    if isinstance(event_type, str):
+        return lambda event: event.type == event_type or event.get_event_name() == event_type
+    if (event_class := _get_event_class(event_type)) is not None:
+        return lambda event: isinstance(event, event_class)
+    return lambda _event: False
+
+
+_RULE_FORBIDDEN_CALLS: dict[type[BaseException], str] = {
+    StopException: "stop()",
+    SkipException: "skip()",
+    JumpToException: "jump_to()",
+    PruningException: "prune()",
+    RejectException: "reject()",
+    FinishException: "finish()",
+}
+"""不应在 `rule()` 中使用的会话控制异常及其对应的方法"""
+_RULE_FORBIDDEN_EXCEPTIONS = tuple(_RULE_FORBIDDEN_CALLS)
+
+
+def _get_forbidden_call(exc: BaseException) -> str:
+    """获取会话控制异常对应的方法名称，异常的子类也会被正确识别。"""
+    for exc_type in type(exc).__mro__:
+        if (name := _RULE_FORBIDDEN_CALLS.get(exc_type)) is not None:
+            return name
+    return type(exc).__name__
+
+
+_NODE_SCOPED_DEPENDENCIES: frozenset[Any] = frozenset({NameT, ConfigT, DependencyCacheT})
+"""分发事件时每个节点注入不同值的依赖"""
+
+
+def _is_node_scoped(dependent: Dependency[Any]) -> bool:
+    """检查依赖的解析结果是否可能因节点而异，无法确定时视为是。"""
+    if dependent in _NODE_SCOPED_DEPENDENCIES:
+        return True
+    try:
+        plan = get_dependency_plan(dependent)
+    except TypeError:
+        return True
+    if plan.kind is DependencyKind.CLASS:
+        return any(_is_node_scoped(dependency) for _, dependency, _ in plan.members)
+    if plan.kind in (DependencyKind.GENERATOR, DependencyKind.ASYNC_GENERATOR):
+        return True
+    for _, param_kind, payload in plan.params:
+        if param_kind is ParamKind.SUB_DEPENDENCY:
+            if _is_node_scoped(payload[0]):
+                return True
+        elif param_kind is ParamKind.LOOKUP and payload in _NODE_SCOPED_DEPENDENCIES:
+            return True
+    return False
+
+
+@lru_cache(maxsize=1024)
+def _is_permission_cacheable(checkers: tuple[Dependency[bool], ...]) -> bool:
+    """检查权限的检查结果能否在同一事件的不同节点间复用。
+
+    检查器依赖节点名称、节点配置等节点相关的值时，不同节点的检查结果可能不同，不能复用。
+    """
+    return not any(_is_node_scoped(checker) for checker in checkers)
+
+
 class Node(Generic[EventT, NodeStateT, ConfigT]):
     """所有 SekaiBot 节点的基类。
 
@@ -82,6 +204,10 @@ class Node(Generic[EventT, NodeStateT, ConfigT]):
         __node_load_type__: 节点加载类型，由 SekaiBot 自动设置，反映了此节点是如何被加载的。
         __node_file_path__: 当节点加载类型为 `NodeLoadType.CLASS` 时为 `None`，
             否则为定义节点在的 Python 模块的位置。
+        __node_event_checker__: 根据 `EventType` 生成的事件类型判断函数，
+            在类定义和节点加载时生成。
+        __node_event_class__: 当 `EventType` 为事件类或其联合类型时为该类型，
+            此时仅凭事件的类即可判断是否匹配，否则为 `None`。
     """
 
     parent: ClassVar[str] = None
@@ -94,6 +220,8 @@ class Node(Generic[EventT, NodeStateT, ConfigT]):
 
     __node_load_type__: ClassVar[NodeLoadType]
     __node_file_path__: ClassVar[str | None]
+    __node_event_checker__: ClassVar[Callable[[Event[Any]], bool]] = staticmethod(_always_true)
+    __node_event_class__: ClassVar[type[Event] | UnionType | None] = None
 
     # 不能使用 ClassVar 因为 PEP 526 不允许这样做
     EventType: str | type[Event]
@@ -131,22 +259,12 @@ class Node(Generic[EventT, NodeStateT, ConfigT]):
 
         orig_bases: tuple[type, ...] = getattr(cls, "__orig_bases__", ())
         for orig_base in orig_bases:
-            origin_class = get_origin(orig_base)
-            if not (inspect.isclass(origin_class) and issubclass(origin_class, Node)):
-                continue
-            try:
-                event_t, state_t, config_t = cast(
-                    tuple[EventT, NodeStateT, ConfigT], get_args(orig_base)
-                )
-            except ValueError:  # pragma: no cover
+            if (parsed := _parse_node_base(orig_base)) is None:
                 continue
-            if event_type is None and (
-                inspect.isclass(event_t)
-                and issubclass(event_t, Event)
-                or isinstance(event_t, UnionType)
-            ):
+            event_t, state_t, config_t = parsed
+            if event_type is None and event_t is not None:
                 event_type = event_t
-            if config is None and inspect.isclass(config_t) and issubclass(config_t, ConfigModel):
+            if config is None and config_t is not None:
                 config = config_t
             if init_state is None:
                 if get_origin(state_t) is Annotated and hasattr(state_t, "__metadata__"):
@@ -166,19 +284,32 @@ class Node(Generic[EventT, NodeStateT, ConfigT]):
             cls.Config = config
         if cls.__init_state__ is Node.__init_state__ and init_state is not None:
             cls.__init_state__ = lambda _: init_state  # type: ignore
+        cls._update_event_checker()
 
         if cls.__name__.startswith("_"):
             cls.load = False
 
     @final
-    @property
+    @classmethod
+    def _update_event_checker(cls) -> None:
+        """根据当前的 `EventType` 重新生成事件类型判断函数。"""
+        if hasattr(cls, "EventType"):
+            cls.__node_event_checker__ = staticmethod(_build_event_checker(cls.EventType))
+            cls.__node_event_class__ = _get_event_class(cls.EventType)
+        else:
+            cls.__node_event_checker__ = staticmethod(_always_true)
+            cls.__node_event_class__ = None
+
+    @final
+    @cached_property
     def name(self) -> str:
         """节点类名称。"""
         return getattr(self, "_name", None) or self.__class__.__name__
 
     @final
-    @property
+    @cached_property
     def bot(self) -> "Bot":
+        """节点所在的 Bot 实例，节点实例化后不会改变，因此只需解析一次。"""
         return self.event.adapter.bot
 
     @final
@@ -266,8 +397,9 @@ class Node(Generic[EventT, NodeStateT, ConfigT]):
         Raises:
             GetEventTimeout: 超过最大事件数或超时。
         """
+        session_id = self.event.get_session_id()
         return await self.bot.manager.get(
-            lambda e: e.get_session_id() == self.event.get_session_id(),
+            lambda e: e.get_session_id() == session_id,
             event_type=type(self.event),
             adapter_type=type(self.event.adapter),
             max_try_times=max_try_times,
@@ -356,6 +488,12 @@ class Node(Generic[EventT, NodeStateT, ConfigT]):
         """
         return await self.event.adapter.call_api(api, **params)
 
+    @final
+    @classmethod
+    def _matches_event(cls, event: Event[Any]) -> bool:
+        """检查事件类型是否与节点的 `EventType` 匹配。"""
+        return cls.__node_event_checker__(event)
+
     @final
     @classmethod
     async def _check_perm(
@@ -365,34 +503,33 @@ class Node(Generic[EventT, NodeStateT, ConfigT]):
         global_state: GlobalStateT,
         stack: AsyncExitStack | None = None,
         dependency_cache: DependencyCacheT | None = None,
+        permission_cache: dict[tuple[Any, ...], bool] | None = None,
     ) -> bool:
         """
         检查节点权限。
+
+        事件类型应事先通过 `_matches_event()` 检查。
+        `permission_cache` 用于在同一事件的分发过程中，复用检查器相同的权限的检查结果，
+        检查器依赖节点相关的值时不复用。
         """
-        return (
-            not hasattr(cls, "EventType")
-            or (
-                isinstance(cls.EventType, str)
-                and (
-                    event.type == (cls.EventType or event.type)
-                    or event.get_event_name() == (cls.EventType or event.type)
-                )
-            )
-            or (
-                (
-                    inspect.isclass(cls.EventType)
-                    and issubclass(cls.EventType, Event)
-                    or isinstance(cls.EventType, UnionType)
-                )
-                and isinstance(event, cls.EventType)
-            )
-        ) and await cls.__node_perm__(
+        perm = cls.__node_perm__
+        key = perm.checkers
+        if permission_cache is not None:
+            if not _is_permission_cacheable(key):
+                permission_cache = None
+            elif key in permission_cache:
+                return permission_cache[key]
+
+        result = await perm(
             bot=bot,
             event=event,
             global_state=global_state,
             stack=stack,
             dependency_cache=dependency_cache,
         )
+        if permission_cache is not None:
+            permission_cache[key] = result
+        return result
 
     @final
     @classmethod
@@ -420,45 +557,15 @@ class Node(Generic[EventT, NodeStateT, ConfigT]):
     @final
     async def _run_rule(self):
         """执行 rule() 方法并返回结果"""
-
-        def _handle_special_exception(
-            exc_group: BaseExceptionGroup[
-                StopException
-                | SkipException
-                | JumpToException
-                | PruningException
-                | RejectException
-                | FinishException
-            ],
-        ):
-            mapping_dict = {
-                StopException: "stop()",
-                SkipException: "skip()",
-                JumpToException: "jump_to()",
-                PruningException: "prune()",
-                RejectException: "reject()",
-                FinishException: "finish()",
-            }
-            for exc in flatten_exception_group(exc_group):
-                if exc in mapping_dict:
-                    logger.warning(
-                        f"You should not use `{mapping_dict[exc]}` in `rule()`, please instead use in node",
-                        node=self.__class__,
-                    )
-
-        with catch(
-            {
-                (
-                    StopException,
-                    SkipException,
-                    JumpToException,
-                    PruningException,
-                    RejectException,
-                    FinishException,
-                ): _handle_special_exception
-            }
-        ):
+        try:
             return await self.rule()
+        except* _RULE_FORBIDDEN_EXCEPTIONS as exc_group:
+            for exc in flatten_exception_group(exc_group):
+                logger.warning(
+                    f"You should not use `{_get_forbidden_call(exc)}` in `rule()`, "
+                    "please instead use in node",
+                    node=self.__class__,
+                )
         return False
 
     @final
@@ -468,24 +575,16 @@ class Node(Generic[EventT, NodeStateT, ConfigT]):
         Raise:
             BaseExceptionGroup[JumpToException | PruningException | RejectException]
         """
-
-        def _handle_stop_exception(exc_group: BaseExceptionGroup[StopException]):
+        try:
+            await self.handle()
+        except* SkipException:
+            logger.debug("Skip exception caught in node", node=self.__class__)
+        except* FinishException:
+            logger.debug("Finish exception caught in node", node=self.__class__)
+        except* StopException:
             logger.debug("Stopping exception caught in node", node=self.__class__)
             self.block = True
 
-        with catch(
-            {
-                SkipException: handle_exception(
-                    "Skip exception caught in node", level="debug", node=self.__class__
-                ),
-                FinishException: handle_exception(
-                    "Finish exception caught in node", level="debug", node=self.__class__
-                ),
-                StopException: _handle_stop_exception,
-            }
-        ):
-            await self.handle()
-
     @final
     async def _run_fallback(self):
         """执行 fallback() 方法并返回结果
@@ -493,27 +592,18 @@ class Node(Generic[EventT, NodeStateT, ConfigT]):
         Raise:
             BaseExceptionGroup[JumpToException | RejectException]
         """
-
-        def _handle_stop_exception(exc_group: BaseExceptionGroup[StopException]):
+        try:
+            await self.fallback()
+        except* SkipException:
+            logger.debug("Skip exception caught in node", node=self.__class__)
+        except* FinishException:
+            logger.debug("Finish exception caught in node", node=self.__class__)
+        except* PruningException:
+            logger.debug("Pruning exception caught in node", node=self.__class__)
+        except* StopException:
             logger.debug("Stopping exception caught in node", node=self.__class__)
             self.block = True
 
-        with catch(
-            {
-                SkipException: handle_exception(
-                    "Skip exception caught in node", level="debug", node=self.__class__
-                ),
-                FinishException: handle_exception(
-                    "Finish exception caught in node", level="debug", node=self.__class__
-                ),
-                PruningException: handle_exception(
-                    "Pruning exception caught in node", level="debug", node=self.__class__
-                ),
-                StopException: _handle_stop_exception,
-            }
-        ):
-            await self.fallback()
-
     @final
     async def _run_node(self) -> PruningException | JumpToException | None:
         """执行 node 并返回结果
@@ -524,44 +614,30 @@ class Node(Generic[EventT, NodeStateT, ConfigT]):
             StopException | Any
         """
         exc: RejectException | JumpToException | PruningException | None = None
+        rule_failed = True
 
-        def _handle_special_exception(
-            exc_group: BaseExceptionGroup[RejectException | JumpToException | PruningException],
-        ):
-            nonlocal exc
+        try:
+            if await self._run_rule():
+                logger.info("Event will be handled by node", node=self.__class__)
+                rule_failed = False
+                await self._run_handle()
+            else:
+                await self._run_fallback()
+        except* (PruningException, JumpToException, RejectException) as exc_group:
             excs = list(flatten_exception_group(exc_group))
             if len(excs) > 1:
                 logger.warning(
                     "Multiple session control exceptions occurred. "
                     "SekaiBot will choose the proper one."
                 )
-                reject = next(
-                    (e for e in excs if isinstance(e, RejectException)),
-                    None,
+                exc = (
+                    next((e for e in excs if isinstance(e, RejectException)), None)
+                    or next((e for e in excs if isinstance(e, JumpToException)), None)
+                    or next((e for e in excs if isinstance(e, PruningException)), None)
                 )
-                jumpto_exc = next(
-                    (e for e in excs if isinstance(e, JumpToException)),
-                    None,
-                )
-                pruning_exc = next(
-                    (e for e in excs if isinstance(e, PruningException)),
-                    None,
-                )
-                exc = reject or jumpto_exc or pruning_exc
-            elif isinstance(excs[0], PruningException | JumpToException | RejectException):
+            else:
                 exc = excs[0]
 
-        rule_failed = True
-
-        with catch(
-            {(PruningException, JumpToException, RejectException): _handle_special_exception}
-        ):
-            if await self._run_rule():
-                logger.info("Event will be handled by node", node=self.__class__)
-                rule_failed = False
-                await self._run_handle()
-            else:
-                await self._run_fallback()
         if exc:
             if isinstance(exc, RejectException):
                 if self.state[REJECT_TARGET]:
@@ -5,7 +5,7 @@ from itertools import chain
 from typing import TYPE_CHECKING, Generic, NoReturn, Self, TypeVar, Union, final
 
 import anyio
-from exceptiongroup import BaseExceptionGroup, catch
+from anyio.abc import TaskGroup
 
 from sekaibot.dependencies import Dependency, Depends, solve_dependencies_in_bot
 from sekaibot.exceptions import SkipException
@@ -16,6 +16,38 @@ if TYPE_CHECKING:
     from sekaibot.bot import Bot
 
 
+_SEQUENTIAL_CHECKERS_THRESHOLD = 3
+"""检查器数量不超过此值时依次运行，超过时才并发运行"""
+
+
+async def _run_permission_checker(
+    checker: Dependency[bool],
+    bot: "Bot",
+    event: Event,
+    global_state: GlobalStateT | None,
+    stack: AsyncExitStack | None,
+    dependency_cache: DependencyCacheT | None,
+    result_box: list[bool],
+    tg: TaskGroup,
+) -> None:
+    """运行单个权限检查器，通过时写入结果并取消其余检查器。"""
+    try:
+        is_passed = await solve_dependencies_in_bot(
+            checker,
+            bot=bot,
+            event=event,
+            global_state=global_state,
+            use_cache=False,
+            stack=stack,
+            dependency_cache=dependency_cache,
+        )
+    except SkipException:
+        return
+    if is_passed:
+        result_box[0] = True
+        tg.cancel_scope.cancel()
+
+
 class Permission:
     """{ref}`nonebot.matcher.Matcher` 权限类。
 
@@ -37,10 +69,12 @@ class Permission:
     def __init__(
         self, *checkers: Union["Permission", PermissionCheckerT, Dependency[bool]]
     ) -> None:
-        self.checkers: set[Dependency[bool]] = set(
-            chain.from_iterable(
-                checker.checkers if isinstance(checker, Permission) else {checker}
-                for checker in checkers
+        self.checkers: tuple[Dependency[bool], ...] = tuple(
+            dict.fromkeys(
+                chain.from_iterable(
+                    checker.checkers if isinstance(checker, Permission) else (checker,)
+                    for checker in checkers
+                )
             )
         )
         """存储 `PermissionChecker`"""
@@ -67,35 +101,40 @@ class Permission:
         if not self.checkers:
             return True
 
-        result = False
-
-        def _handle_skipped_exception(
-            exc_group: BaseExceptionGroup[SkipException],
-        ) -> None:
-            nonlocal result
-            result = False
-
-        async def _run_checker(checker: Dependency[bool]) -> None:
-            nonlocal result
-            is_passed = await solve_dependencies_in_bot(
-                checker,
-                bot=bot,
-                event=event,
-                global_state=global_state,
-                use_cache=False,
-                stack=stack,
-                dependency_cache=dependency_cache,
-            )
-            if is_passed:
-                result = True
-                tg.cancel_scope.cancel()
-
-        with catch({SkipException: _handle_skipped_exception}):
-            async with anyio.create_task_group() as tg:
-                for checker in self.checkers:
-                    tg.start_soon(_run_checker, checker)
-
-        return result
+        if len(self.checkers) <= _SEQUENTIAL_CHECKERS_THRESHOLD:
+            # 检查器较少时依次运行并在首个通过时返回，避免创建任务组的开销
+            for checker in self.checkers:
+                try:
+                    if await solve_dependencies_in_bot(
+                        checker,
+                        bot=bot,
+                        event=event,
+                        global_state=global_state,
+                        use_cache=False,
+                        stack=stack,
+                        dependency_cache=dependency_cache,
+                    ):
+                        return True
+                except SkipException:
+                    continue
+            return False
+
+        result_box = [False]
+        async with anyio.create_task_group() as tg:
+            for checker in self.checkers:
+                tg.start_soon(
+                    _run_permission_checker,
+                    checker,
+                    bot,
+                    event,
+                    global_state,
+                    stack,
+                    dependency_cache,
+                    result_box,
+                    tg,
+                )
+
+        return result_box[0]
 
     def __and__(self, other: object) -> NoReturn:
         raise RuntimeError("And operation between Permissions is not allowed.")
@@ -12,6 +12,7 @@ FrontMatter:
 """
 
 from typing import TYPE_CHECKING, Self
+from weakref import WeakValueDictionary
 
 from sekaibot.internal.event import Event
 from sekaibot.internal.permission import Permission as Permission
@@ -19,6 +20,9 @@ from sekaibot.internal.permission import Permission as Permission
 if TYPE_CHECKING:
     from sekaibot.bot import Bot
 
+_USERS_INTERN: WeakValueDictionary[tuple[str, ...], frozenset[str]] = WeakValueDictionary()
+"""在 `UserPermission` 实例之间共享相同的会话白名单集合"""
+
 
 class UserPermission:
     """检查当前事件是否属于指定会话。
@@ -31,11 +35,16 @@ class UserPermission:
         perm: 要求用户需同时满足的权限
     """
 
-    __slots__ = ("perm", "users")
+    __slots__ = ("perm", "users", "_users_set")
 
     def __init__(self, users: tuple[str, ...], perm: Permission | None = None) -> None:
         self.users = users
         self.perm = perm
+        key = tuple(sorted(users))
+        users_set = _USERS_INTERN.get(key)
+        if users_set is None:
+            users_set = _USERS_INTERN.setdefault(key, frozenset(users))
+        self._users_set = users_set
 
     def __repr__(self) -> str:
         return (
@@ -45,8 +54,13 @@ class UserPermission:
     async def __call__(self, event: Event) -> bool:
         try:
             session = event.get_session_id()
-        except Exception:
+        except (NotImplementedError, ValueError):
+            # 事件没有会话 ID
+            return False
+        if session is None:
             return False
+        if session in self._users_set:
+            return True
         return any(user in session for user in self.users)
 
     @classmethod
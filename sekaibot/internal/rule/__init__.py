@@ -1,10 +1,10 @@
 from collections.abc import Awaitable, Callable
 from contextlib import AsyncExitStack
+from functools import lru_cache
 from itertools import chain
-from typing import TYPE_CHECKING, Generic, NoReturn, Self, TypeVar, Union, final
+from typing import TYPE_CHECKING, Any, Generic, NoReturn, Self, TypeVar, Union, final
 
 import anyio
-from exceptiongroup import BaseExceptionGroup, catch
 
 from sekaibot.dependencies import Dependency, Depends, solve_dependencies_in_bot
 from sekaibot.exceptions import SkipException
@@ -16,6 +16,9 @@ if TYPE_CHECKING:
 
 __all__ = ["Rule", "RuleChecker", "MatchRule"]
 
+_SEQUENTIAL_CHECKERS_THRESHOLD = 3
+"""检查器数量不超过此值时依次运行，超过时才并发运行"""
+
 
 class Rule:
     """{ref}`nonebot.matcher.Matcher` 规则类。
@@ -68,34 +71,49 @@ class Rule:
         if not self.checkers:
             return True
 
-        result = True
+        if len(self.checkers) <= _SEQUENTIAL_CHECKERS_THRESHOLD:
+            # 检查器较少时依次运行并在首个未通过时返回，避免创建任务组的开销
+            for checker in self.checkers:
+                try:
+                    if not await solve_dependencies_in_bot(
+                        checker,
+                        bot=bot,
+                        event=event,
+                        state=state,
+                        global_state=global_state,
+                        use_cache=False,
+                        stack=stack,
+                        dependency_cache=dependency_cache,
+                    ):
+                        return False
+                except SkipException:
+                    return False
+            return True
 
-        def _handle_skipped_exception(
-            exc_group: BaseExceptionGroup[SkipException],
-        ) -> None:
-            nonlocal result
-            result = False
+        result = True
 
         async def _run_checker(checker: Dependency[bool]) -> None:
             nonlocal result
-            is_passed = await solve_dependencies_in_bot(
-                checker,
-                bot=bot,
-                event=event,
-                state=state,
-                global_state=global_state,
-                use_cache=False,
-                stack=stack,
-                dependency_cache=dependency_cache,
-            )
+            try:
+                is_passed = await solve_dependencies_in_bot(
+                    checker,
+                    bot=bot,
+                    event=event,
+                    state=state,
+                    global_state=global_state,
+                    use_cache=False,
+                    stack=stack,
+                    dependency_cache=dependency_cache,
+                )
+            except SkipException:
+                is_passed = False
             if not is_passed:
                 result = False
                 tg.cancel_scope.cancel()
 
-        with catch({SkipException: _handle_skipped_exception}):
-            async with anyio.create_task_group() as tg:
-                for checker in self.checkers:
-                    tg.start_soon(_run_checker, checker)
+        async with anyio.create_task_group() as tg:
+            for checker in self.checkers:
+                tg.start_soon(_run_checker, checker)
 
         return result
 
@@ -137,11 +155,24 @@ ArgsT = TypeVar("T")
 ParamT = TypeVar("P")
 
 
+@lru_cache(maxsize=4096)
+def _build_checker(
+    checker_class: type["RuleChecker[Any]"],
+    args: tuple[Any, ...],
+    kwargs: tuple[tuple[str, Any], ...],
+) -> Any:
+    """构建检查器的子依赖，相同的检查器类和参数共享同一个检查器。"""
+    return Depends(checker_class._rule_check(*args, **dict(kwargs)), use_cache=False)
+
+
 class RuleChecker(Generic[ArgsT]):
     """抽象基类，匹配消息规则。"""
 
-    def __init__(self, rule: Rule) -> None:
-        self.__rule__ = rule
+    __slots__ = ("__rule__",)
+
+    def __init__(self, rule: Rule | Dependency[bool]) -> None:
+        # 统一包装为 Rule，`_check()` 才能以 Rule 的调用方式运行检查器
+        self.__rule__ = rule if isinstance(rule, Rule) else Rule(rule)
 
     def __call__(self, cls: NodeT) -> NodeT:
         """将检查器添加到 Node 类中。"""
@@ -159,8 +190,16 @@ class RuleChecker(Generic[ArgsT]):
 
     @classmethod
     def Checker(cls, *args: ArgsT, **kwargs) -> bool:
-        """默认实现检查方法的依赖注入方法，子类可覆盖。"""
-        return Depends(cls._rule_check(*args, **kwargs), use_cache=False)
+        """默认实现检查方法的依赖注入方法，子类可覆盖。
+
+        参数均可哈希时，相同参数的检查器只会构建一次。
+        """
+        kwargs_items = tuple(kwargs.items())
+        try:
+            hash((args, kwargs_items))
+        except TypeError:  # 参数不可哈希时不缓存
+            return Depends(cls._rule_check(*args, **kwargs), use_cache=False)
+        return _build_checker(cls, args, kwargs_items)
 
     @final
     async def _check(
@@ -17,14 +17,13 @@ import shlex
 from argparse import Action, ArgumentError
 from argparse import ArgumentParser as ArgParser
 from argparse import Namespace as Namespace
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from contextvars import ContextVar
+from functools import lru_cache, partial
 from gettext import gettext
-from itertools import chain, product
+from itertools import chain
 from typing import IO, TYPE_CHECKING, NamedTuple, TypedDict, TypeVar, cast, overload
 
-from pygtrie import CharTrie
-
 from sekaibot.consts import (
     BOT_GLOBAL_KEY,
     CMD_ARG_KEY,
@@ -50,9 +49,11 @@ from sekaibot.internal.message import Message, MessageSegment
 from sekaibot.internal.rule import Rule
 from sekaibot.log import logger
 from sekaibot.typing import GlobalStateT, NameT, StateT
-from sekaibot.utils import Counter
+from sekaibot.utils import Counter, fold_case
 
 if TYPE_CHECKING:
+    from ahocorasick import Automaton
+
     from sekaibot.bot import Bot
 
 T = TypeVar("T")
@@ -74,6 +75,63 @@ class TRIE_VALUE(NamedTuple):
 parser_message: ContextVar[str] = ContextVar("parser_message")
 
 
+def _get_plain_text(event: Event) -> str:
+    """获取事件的消息纯文本，结果缓存在事件上。"""
+    text = event._plain_text  # pyright: ignore[reportPrivateUsage]
+    if text is None:
+        text = event._plain_text = event.get_plain_text()  # pyright: ignore[reportPrivateUsage]
+    return text
+
+
+def _get_folded_text(event: Event) -> str:
+    """获取事件忽略大小写后的消息纯文本，结果缓存在事件上。"""
+    text = event._folded_text  # pyright: ignore[reportPrivateUsage]
+    if text is None:
+        text = event._folded_text = fold_case(_get_plain_text(event))  # pyright: ignore[reportPrivateUsage]
+    return text
+
+
+def _get_message_text(event: Event) -> str:
+    """获取事件消息转换成的字符串，结果缓存在事件上。"""
+    text = event._message_text  # pyright: ignore[reportPrivateUsage]
+    if text is None:
+        text = event._message_text = str(event.get_message())  # pyright: ignore[reportPrivateUsage]
+    return text
+
+
+def _get_folded_message_text(event: Event) -> str:
+    """获取事件忽略大小写后的消息字符串，结果缓存在事件上。"""
+    text = event._folded_message_text  # pyright: ignore[reportPrivateUsage]
+    if text is None:
+        text = event._folded_message_text = fold_case(_get_message_text(event))  # pyright: ignore[reportPrivateUsage]
+    return text
+
+
+def _fold_needles(
+    msgs: tuple[str | MessageSegment, ...], ignorecase: bool
+) -> tuple[tuple[str | MessageSegment, str | MessageSegment], ...]:
+    """预先折叠需要匹配的字符串，返回 `(原始值, 用于匹配的值)` 元组。
+
+    折叠后相同的匹配值只保留第一个，后面的永远不会先于它被匹配到。
+    """
+    needles: dict[str | MessageSegment, str | MessageSegment] = {}
+    for msg in msgs:
+        needles.setdefault(fold_case(msg) if ignorecase and isinstance(msg, str) else msg, msg)
+    return tuple((msg, needle) for needle, msg in needles.items())
+
+
+def _split_needles(
+    needles: tuple[tuple[str | MessageSegment, str | MessageSegment], ...],
+) -> tuple[tuple[str, ...], tuple[MessageSegment, ...]]:
+    """将匹配值分为字符串元组和 MessageSegment 元组。
+
+    字符串元组可以直接传给 `str.startswith()` / `str.endswith()`，在 C 层一次性检查所有目标。
+    """
+    strs = tuple(needle for _, needle in needles if isinstance(needle, str))
+    segments = tuple(needle for _, needle in needles if not isinstance(needle, str))
+    return strs, segments
+
+
 class StartswithRule:
     """检查消息富文本是否以指定字符串或 MessageSegment 开头。
 
@@ -82,11 +140,15 @@ class StartswithRule:
         ignorecase: 是否忽略大小写
     """
 
-    __slots__ = ("ignorecase", "msgs")
+    __slots__ = ("ignorecase", "msgs", "_key", "_hash", "_needles", "_strs", "_segments")
 
     def __init__(self, msgs: tuple[str | MessageSegment, ...], ignorecase: bool = False):
         self.msgs = msgs
         self.ignorecase = ignorecase
+        self._key = frozenset(msgs)
+        self._hash = hash((self._key, ignorecase))
+        self._needles = _fold_needles(msgs, ignorecase)
+        self._strs, self._segments = _split_needles(self._needles)
 
     def __repr__(self) -> str:
         return f"Startswith(msg={self.msgs}, ignorecase={self.ignorecase})"
@@ -94,21 +156,28 @@ class StartswithRule:
     def __eq__(self, other: object) -> bool:
         return (
             isinstance(other, StartswithRule)
-            and frozenset(self.msgs) == frozenset(other.msgs)
+            and self._key == other._key
             and self.ignorecase == other.ignorecase
         )
 
     def __hash__(self) -> int:
-        return hash((frozenset(self.msgs), self.ignorecase))
+        return self._hash
 
     async def __call__(self, event: Event, state: StateT) -> bool:
         try:
-            message = event.get_message()
+            text = _get_folded_message_text(event) if self.ignorecase else _get_message_text(event)
+            # 只有存在 MessageSegment 类型的匹配目标时才需要获取消息本身
+            message = event.get_message() if self._segments else None
         except Exception:
             return False
-        if match := message.startswith(self.msgs, ignorecase=self.ignorecase, return_key=True):
-            state[STARTSWITH_KEY] = match
-            return True
+        first = message[0] if message else None
+        # 先在 C 层一次性检查所有字符串，再检查首个消息段，两者都不匹配时无需进入逐个比较的循环
+        if not text.startswith(self._strs) and first not in self._segments:
+            return False
+        for msg, needle in self._needles:
+            if text.startswith(needle) if isinstance(needle, str) else first == needle:
+                state[STARTSWITH_KEY] = msg
+                return True
         return False
 
 
@@ -120,11 +189,15 @@ class EndswithRule:
         ignorecase: 是否忽略大小写
     """
 
-    __slots__ = ("ignorecase", "msgs")
+    __slots__ = ("ignorecase", "msgs", "_key", "_hash", "_needles", "_strs", "_segments")
 
     def __init__(self, msgs: tuple[str | MessageSegment, ...], ignorecase: bool = False):
         self.msgs = msgs
         self.ignorecase = ignorecase
+        self._key = frozenset(msgs)
+        self._hash = hash((self._key, ignorecase))
+        self._needles = _fold_needles(msgs, ignorecase)
+        self._strs, self._segments = _split_needles(self._needles)
 
     def __repr__(self) -> str:
         return f"Endswith(msg={self.msgs}, ignorecase={self.ignorecase})"
@@ -132,21 +205,27 @@ class EndswithRule:
     def __eq__(self, other: object) -> bool:
         return (
             isinstance(other, EndswithRule)
-            and frozenset(self.msgs) == frozenset(other.msgs)
+            and self._key == other._key
             and self.ignorecase == other.ignorecase
         )
 
     def __hash__(self) -> int:
-        return hash((frozenset(self.msgs), self.ignorecase))
+        return self._hash
 
     async def __call__(self, event: Event, state: StateT) -> bool:
         try:
-            message = event.get_message()
+            text = _get_folded_message_text(event) if self.ignorecase else _get_message_text(event)
+            # 只有存在 MessageSegment 类型的匹配目标时才需要获取消息本身
+            message = event.get_message() if self._segments else None
         except Exception:
             return False
-        if match := message.endswith(self.msgs, ignorecase=self.ignorecase, return_key=True):
-            state[ENDSWITH_KEY] = match
-            return True
+        last = message[-1] if message else None
+        if not text.endswith(self._strs) and last not in self._segments:
+            return False
+        for msg, needle in self._needles:
+            if text.endswith(needle) if isinstance(needle, str) else last == needle:
+                state[ENDSWITH_KEY] = msg
+                return True
         return False
 
 
@@ -158,51 +237,74 @@ class FullmatchRule:
         ignorecase: 是否忽略大小写
     """
 
-    __slots__ = ("ignorecase", "msgs")
+    __slots__ = ("ignorecase", "msgs", "messages", "_hash")
 
     def __init__(self, msgs: tuple[str | Message | MessageSegment, ...], ignorecase: bool = False):
-        self.msgs: set[str | Message] = set(
-            msg.casefold()
-            if ignorecase and isinstance(msg, str)
-            else msg.get_message_class()(msg)
-            if isinstance(msg, MessageSegment)
-            else msg
+        # 字符串与消息分开保存：消息不可哈希，不能放入集合
+        strs = [msg for msg in msgs if isinstance(msg, str)]
+        self.msgs: frozenset[str] = frozenset(map(fold_case, strs) if ignorecase else strs)
+        self.messages: tuple[Message, ...] = tuple(
+            msg.get_message_class()(msg) if isinstance(msg, MessageSegment) else msg
             for msg in msgs
+            if not isinstance(msg, str)
         )
         self.ignorecase = ignorecase
+        self._hash = hash((self.msgs, ignorecase))
 
     def __repr__(self) -> str:
-        return f"Fullmatch(msg={self.msgs}, ignorecase={self.ignorecase})"
+        return f"Fullmatch(msg={self.msgs}, messages={self.messages}, ignorecase={self.ignorecase})"
 
     def __eq__(self, other: object) -> bool:
         return (
             isinstance(other, FullmatchRule)
-            and frozenset(self.msgs) == frozenset(other.msgs)
+            and self.msgs == other.msgs
+            and self.messages == other.messages
             and self.ignorecase == other.ignorecase
         )
 
     def __hash__(self) -> int:
-        return hash((frozenset(self.msgs), self.ignorecase))
+        return self._hash
 
     async def __call__(self, event: Event, state: StateT) -> bool:
         try:
-            text = event.get_plain_text()
-            message = event.get_message()
+            text = _get_folded_text(event) if self.ignorecase else _get_plain_text(event)
         except Exception:
             return False
         if not text:
             return False
-        text = text.casefold() if self.ignorecase else text
 
         if text in self.msgs:
             state[FULLMATCH_KEY] = text
             return True
-        elif message in self.msgs:
-            state[FULLMATCH_KEY] = message
-            return True
+        if self.messages:
+            # 只有存在消息类型的匹配目标时才需要获取消息
+            try:
+                message = event.get_message()
+            except Exception:
+                return False
+            if message in self.messages:
+                state[FULLMATCH_KEY] = message
+                return True
         return False
 
 
+@lru_cache(maxsize=256)
+def _build_automaton(words: frozenset[str]) -> "Automaton | None":
+    """为关键字集合构建 Aho-Corasick 自动机，相同的关键字集合共享同一个自动机。
+
+    未安装 `pyahocorasick` 时返回 `None`。
+    """
+    try:
+        from ahocorasick import Automaton
+    except ImportError:
+        return None
+    automaton = Automaton()
+    for word in words:
+        automaton.add_word(word, word)
+    automaton.make_automaton()
+    return automaton
+
+
 class KeywordsRule:
     """检查消息纯文本是否包含指定关键字。
 
@@ -210,14 +312,29 @@ class KeywordsRule:
         keywords: 指定关键字集合
     """
 
-    __slots__ = ("ignorecase", "keywords")
+    __slots__ = (
+        "ignorecase",
+        "keywords",
+        "_str_keywords",
+        "_segment_keywords",
+        "_automaton",
+        "_hash",
+    )
 
     def __init__(self, keywords: tuple[str | MessageSegment, ...], ignorecase: bool = False):
-        self.keywords = set(
-            keyword.casefold() if ignorecase and isinstance(keyword, str) else keyword
-            for keyword in keywords
+        strs = {keyword for keyword in keywords if isinstance(keyword, str)}
+        self._str_keywords: tuple[str, ...] = tuple(
+            set(map(fold_case, strs)) if ignorecase else strs
         )
+        self._segment_keywords: tuple[MessageSegment, ...] = tuple(
+            {keyword for keyword in keywords if not isinstance(keyword, str)}
+        )
+        self.keywords = frozenset((*self._str_keywords, *self._segment_keywords))
         self.ignorecase = ignorecase
+        self._hash = hash(self.keywords)
+        self._automaton = (
+            _build_automaton(frozenset(self._str_keywords)) if self._str_keywords else None
+        )
 
     def __repr__(self) -> str:
         return f"Keywords(keywords={self.keywords}, ignorecase={self.ignorecase})"
@@ -225,25 +342,34 @@ class KeywordsRule:
     def __eq__(self, other: object) -> bool:
         return (
             isinstance(other, KeywordsRule)
-            and frozenset(self.keywords) == frozenset(other.keywords)
+            and self.keywords == other.keywords
             and self.ignorecase == other.ignorecase
         )
 
     def __hash__(self) -> int:
-        return hash(frozenset(self.keywords))
+        return self._hash
 
     async def __call__(self, event: Event, state: StateT) -> bool:
         try:
-            text = event.get_plain_text()
-            message = event.get_message()
+            text = _get_folded_text(event) if self.ignorecase else _get_plain_text(event)
+            if not text:
+                return False
+            message_text = _get_message_text(event)
+            # 只有存在消息字段关键字时才需要获取消息本身
+            message = event.get_message() if self._segment_keywords else None
         except Exception:
             return False
-        if not text:
-            return False
-        text = text.casefold() if self.ignorecase else text
-        if keys := tuple(
-            k for k in self.keywords if (isinstance(k, str) and (k in text)) or k in message
-        ):
+        if self._automaton is not None:
+            # 一次遍历找出纯文本与消息文本中出现的所有字符串关键字
+            matched = {keyword for _, keyword in self._automaton.iter(text)}
+            if message_text != text:
+                matched.update(keyword for _, keyword in self._automaton.iter(message_text))
+            keys = tuple(k for k in self._str_keywords if k in matched)
+        else:
+            keys = tuple(k for k in self._str_keywords if k in text or k in message_text)
+        if message is not None:
+            keys += tuple(k for k in self._segment_keywords if k in message)
+        if keys:
             state[KEYWORD_KEY] = keys
             return True
         return False
@@ -257,10 +383,11 @@ class WordFilterRule:
         word_file: 可选的词库文件路径（每行一个词）
         ignorecase: 是否忽略大小写
         use_pinyin: 是否启用拼音匹配，使用 `pypinyin` 库
-        use_aho: 是否启用 Aho-Corasick 算法（当词数较大时自动激活），使用 `pyahocorasick` 库
+        use_aho: 是否强制要求使用 Aho-Corasick 算法，使用 `pyahocorasick` 库；
+            未指定时若已安装 `pyahocorasick` 也会自动使用
     """
 
-    __slots__ = ("ignorecase", "words", "use_pinyin", "use_aho", "_automaton")
+    __slots__ = ("ignorecase", "words", "use_pinyin", "use_aho", "_automaton", "_pinyin", "_hash")
 
     def __init__(
         self,
@@ -271,15 +398,16 @@ class WordFilterRule:
         use_aho: bool = False,
     ):
         self.ignorecase = ignorecase
-        self.words: set[str] = set()
+        self.words: frozenset[str] | set[str] = set()
         self.use_aho = use_aho
         self._automaton = None
+        self._pinyin: Callable[[str], list[str]] | None = None
 
         if word_file:
             self._load_word_set(word_file)
 
         self.words.update(
-            word.casefold() if ignorecase and isinstance(word, str) else word for word in words
+            fold_case(word) if ignorecase and isinstance(word, str) else word for word in words
         )
 
         self.use_pinyin = use_pinyin
@@ -290,24 +418,19 @@ class WordFilterRule:
             except ImportError:
                 raise ImportError("pypinyin is not installed, please install it first.") from None
 
-            self.words = set(
-                "".join(lazy_pinyin(word, style=Style.FIRST_LETTER)).casefold() if ignorecase else
-                "".join(lazy_pinyin(word, style=Style.FIRST_LETTER))
-                for word in self.words
-            )
+            self._pinyin = partial(lazy_pinyin, style=Style.FIRST_LETTER)
+            self.words = {
+                fold_case(pinyin) if ignorecase else pinyin
+                for pinyin in ("".join(self._pinyin(word)) for word in self.words)
+            }
 
-        if self.use_aho and len(self.words) > 2000:
-            try:
-                from ahocorasick import Automaton
+        self.words = frozenset(self.words)
+        self._hash = hash((self.words, self.ignorecase, self.use_pinyin, self.use_aho))
 
-                self._automaton = Automaton()
-                for idx, word in enumerate(self.words):
-                    self._automaton.add_word(word, (idx, word))
-                self._automaton.make_automaton()
-            except ImportError:
-                raise ImportError(
-                    "pyahocorasick is not installed, please install it first."
-                ) from None
+        if self.words:
+            self._automaton = _build_automaton(self.words)
+            if self._automaton is None and self.use_aho:
+                raise ImportError("pyahocorasick is not installed, please install it first.")
 
     def __repr__(self) -> str:
         return (
@@ -318,14 +441,14 @@ class WordFilterRule:
     def __eq__(self, other: object) -> bool:
         return (
             isinstance(other, WordFilterRule)
-            and frozenset(self.words) == frozenset(other.words)
+            and self.words == other.words
             and self.ignorecase == other.ignorecase
             and self.use_pinyin == other.use_pinyin
             and self.use_aho == other.use_aho
         )
 
     def __hash__(self) -> int:
-        return hash((frozenset(self.words), self.ignorecase, self.use_pinyin, self.use_aho))
+        return self._hash
 
     async def __call__(self, event: Event) -> bool:
         """执行敏感词检测。
@@ -333,25 +456,20 @@ class WordFilterRule:
         Return:
             bool: 如果消息合法（不包含敏感词）返回 True，否则 False
         """
+        if not self.words:
+            return True
         try:
-            text = event.get_plain_text()
+            text = _get_folded_text(event) if self.ignorecase else _get_plain_text(event)
         except Exception:
             return True
         if not text:
             return True
 
-        text = text.casefold() if self.ignorecase else text
+        if self._pinyin is not None:
+            text += "".join(self._pinyin(text))
 
-        if self.use_pinyin:
-            try:
-                from pypinyin import Style, lazy_pinyin
-            except ImportError:
-                raise ImportError("pypinyin is not installed, please install it first.") from None
-
-            text += "".join(lazy_pinyin(text, style=Style.FIRST_LETTER))
-
-        if self._automaton:
-            return not any(True for _, (_, word) in self._automaton.iter(text))
+        if self._automaton is not None:
+            return next(self._automaton.iter(text), None) is None
 
         return not any(word in text for word in self.words)
 
@@ -364,53 +482,55 @@ class WordFilterRule:
         if not os.path.isfile(file_path):
             raise FileNotFoundError(f"File {file_path} not found.")
 
-        word_set: list[str] = []
         try:
             with open(file_path, encoding="utf-8") as file:
-                for _, line in enumerate(file, start=1):
-                    word = line.strip()
-                    if word:
-                        word_set.append(word)
+                lines = file.read().splitlines()
         except (OSError, UnicodeDecodeError) as e:
             raise RuntimeError("Read file error") from e
 
         self.words.update(
-            word.casefold() if self.ignorecase and isinstance(word, str) else word
-            for word in word_set
+            fold_case(word) if self.ignorecase else word for line in lines if (word := line.strip())
         )
 
 
+@lru_cache(maxsize=1024)
+def _compile_regex(regex: str | re.Pattern[str], flags: int) -> re.Pattern[str]:
+    """编译正则表达式，相同的表达式和标记共享同一个编译结果。"""
+    return re.compile(regex, flags)
+
+
 class RegexRule:
     """检查消息字符串是否符合指定正则表达式。
 
     Args:
-        regex: 正则表达式
-        flags: 正则表达式标记
+        regex: 正则表达式或已编译的正则表达式
+        flags: 正则表达式标记，传入已编译的正则表达式时必须为 0
     """
 
-    __slots__ = ("flags", "regex")
+    __slots__ = ("flags", "regex", "_pattern", "_search")
 
-    def __init__(self, regex: str, flags: int = 0):
-        self.regex = regex
+    def __init__(self, regex: str | re.Pattern[str], flags: int = 0):
+        self._pattern = _compile_regex(regex, flags)
+        # 预先绑定 search 方法，匹配时无需再经由 Pattern 对象查找
+        self._search = self._pattern.search
+        self.regex = self._pattern.pattern
         self.flags = flags
 
     def __repr__(self) -> str:
         return f"Regex(regex={self.regex!r}, flags={self.flags})"
 
     def __eq__(self, other: object) -> bool:
-        return (
-            isinstance(other, RegexRule) and self.regex == other.regex and self.flags == other.flags
-        )
+        return isinstance(other, RegexRule) and self._pattern == other._pattern
 
     def __hash__(self) -> int:
-        return hash((self.regex, self.flags))
+        return hash(self._pattern)
 
     async def __call__(self, event: Event, state: StateT) -> bool:
         try:
-            msg = event.get_message()
+            text = _get_message_text(event)
         except Exception:
             return False
-        if matched := re.search(self.regex, str(msg), self.flags):
+        if matched := self._search(text):
             state[REGEX_MATCHED] = matched
             return True
         else:
@@ -484,6 +604,9 @@ class CountTriggerRule:
             counter.record(event, True, getattr(event, "time", None))
 
         trigger = False
+        # 记录总数不足时不可能触发，无需扫描窗口
+        if len(counter) < self.min_trigger:
+            return trigger
         if (
             self.time_window
             and len(
@@ -497,6 +620,7 @@ class CountTriggerRule:
             trigger = True
         if (
             self.count_window
+            and self.count_window >= self.min_trigger
             and len(count_trigger := tuple(counter.iter_in_latest(self.count_window)))
             >= self.min_trigger
         ):
@@ -506,18 +630,57 @@ class CountTriggerRule:
 
 
 class TrieRule:
-    prefix: CharTrie
+    """命令前缀表，按最长前缀匹配命令。
+
+    命令前缀只在启动时注册，之后只读。因此前缀保存在字典中，查找时按前缀长度
+    从长到短对文本切片并查表，整个查找过程都在 C 实现的字典中完成。
+    """
+
+    __slots__ = ("prefix", "_lengths")
 
     def __init__(self):
-        self.prefix = CharTrie()
+        self.prefix: dict[str, TRIE_VALUE] = {}
+        self._lengths: tuple[int, ...] = ()
 
     def add_prefix(self, prefix: str, value: TRIE_VALUE) -> None:
         if prefix in self.prefix:
-            logger.warning(f'Duplicated prefix rule "{prefix}"')
+            if self.prefix[prefix] != value:
+                logger.warning(f'Duplicated prefix rule "{prefix}"')
             return
         self.prefix[prefix] = value
+        if len(prefix) not in self._lengths:
+            self._lengths = tuple(sorted((*self._lengths, len(prefix)), reverse=True))
+
+    def longest_prefix(self, text: str) -> tuple[str, TRIE_VALUE] | None:
+        """查找文本的最长命令前缀。
+
+        Args:
+            text: 需要匹配的文本。
+
+        Returns:
+            匹配到的前缀及其对应的值，未匹配时返回 `None`。
+        """
+        text_len = len(text)
+        for length in self._lengths:
+            if length <= text_len and (value := self.prefix.get(key := text[:length])):
+                return key, value
+        return None
 
     def get_value(self, event: Event, state: StateT) -> CMD_RESULT:
+        """获取事件的命令匹配结果并写入 `state`。
+
+        同一事件的匹配结果会缓存在事件上，多个命令规则只需匹配一次。
+        """
+        cached = event._command_prefix  # pyright: ignore[reportPrivateUsage]
+        if cached is None or cached[0] is not self:
+            cached = event._command_prefix = (self, self._match(event))  # pyright: ignore[reportPrivateUsage]
+        prefix = cached[1].copy()
+        if (command_arg := prefix[CMD_ARG_KEY]) is not None:
+            prefix[CMD_ARG_KEY] = command_arg.copy()
+        state[PREFIX_KEY] = prefix
+        return prefix
+
+    def _match(self, event: Event) -> CMD_RESULT:
         prefix = CMD_RESULT(
             command=None,
             raw_command=None,
@@ -525,45 +688,70 @@ class TrieRule:
             command_start=None,
             command_whitespace=None,
         )
-        state[PREFIX_KEY] = prefix
         if event.type != "message":
             return prefix
 
         message = event.get_message()
+        if not message:
+            return prefix
         message_seg: MessageSegment = message[0]
         if message_seg.is_text():
             segment_text = str(message_seg).lstrip()
-            if pf := self.prefix.longest_prefix(segment_text):
-                value: TRIE_VALUE = pf.value
-                prefix[RAW_CMD_KEY] = pf.key
+            if pf := self.longest_prefix(segment_text):
+                raw_command, value = pf
+                prefix[RAW_CMD_KEY] = raw_command
                 prefix[CMD_START_KEY] = value.command_start
                 prefix[CMD_KEY] = value.command
 
-                msg = message.copy()
-                msg.pop(0)
-
                 # check whitespace
-                arg_str = segment_text[len(pf.key) :]
+                arg_str = segment_text[len(raw_command) :]
                 arg_str_stripped = arg_str.lstrip()
                 # check next segment until arg detected or no text remain
-                while not arg_str_stripped and msg and msg[0].is_text():
-                    arg_str += str(msg.pop(0))
+                index, length = 1, len(message)
+                while not arg_str_stripped and index < length and message[index].is_text():
+                    arg_str += str(message[index])
                     arg_str_stripped = arg_str.lstrip()
+                    index += 1
 
-                has_arg = arg_str_stripped or msg
+                has_arg = arg_str_stripped or index < length
                 if has_arg and (stripped_len := len(arg_str) - len(arg_str_stripped)) > 0:
                     prefix[CMD_WHITESPACE_KEY] = arg_str[:stripped_len]
 
                 # construct command arg
                 if arg_str_stripped:
-                    new_message = msg.__class__(arg_str_stripped)
-                    for new_segment in reversed(new_message):
-                        msg.insert(0, new_segment)
+                    msg = message.__class__(arg_str_stripped, message[index:])
+                else:
+                    msg = message.__class__(message[index:])
                 prefix[CMD_ARG_KEY] = msg
 
         return prefix
 
 
+_COMMAND_TRIE = TrieRule()
+"""所有命令规则共享的命令前缀树"""
+
+
+def _normalize_commands(cmds: Sequence[str | tuple[str, ...]]) -> tuple[tuple[str, ...], ...]:
+    """将命令统一转换为命令元组。"""
+    return tuple((command,) if isinstance(command, str) else tuple(command) for command in cmds)
+
+
+def _add_command_prefixes(cmds: tuple[tuple[str, ...], ...], bot: "Bot") -> None:
+    """根据机器人配置的命令起始符与分隔符，将命令注册到共享的命令前缀树中。"""
+    command_start = bot.config.rule.command_start
+    command_sep = bot.config.rule.command_sep
+
+    for command in cmds:
+        if len(command) == 1:
+            joined = (command[0],)
+        else:
+            joined = tuple({sep.join(command) for sep in command_sep})
+        for start in command_start:
+            value = TRIE_VALUE(start, command)
+            for text in joined:
+                _COMMAND_TRIE.add_prefix(start + text, value)
+
+
 class CommandRule:
     """检查消息是否为指定命令。
 
@@ -572,62 +760,46 @@ class CommandRule:
         force_whitespace: 是否强制命令后必须有指定空白符
     """
 
-    __slots__ = ("cmds", "force_whitespace", "char_trie")
+    __slots__ = ("cmds", "force_whitespace", "_key", "_hash")
 
     def __init__(
         self,
-        cmds: list[tuple[str, ...]],
+        cmds: Sequence[str | tuple[str, ...]],
         force_whitespace: str | bool | None = None,
     ):
-        self.cmds = tuple(cmds)
+        self.cmds = _normalize_commands(cmds)
         self.force_whitespace = force_whitespace
-        self.char_trie = TrieRule()
+        self._key = frozenset(self.cmds)
+        self._hash = hash((self._key,))
 
         from sekaibot.bot import Bot
 
         Bot.bot_startup_hook(self._set_prefix)
 
     def _set_prefix(self, bot: "Bot"):
-        command_start = bot.config.rule.command_start
-        command_sep = bot.config.rule.command_sep
-
-        commands: list[tuple[str, ...]] = []
-        for command in self.cmds:
-            if isinstance(command, str):
-                command = (command,)
-
-            commands.append(command)
-
-            if len(command) == 1:
-                for start in command_start:
-                    self.char_trie.add_prefix(f"{start}{command[0]}", TRIE_VALUE(start, command))
-            else:
-                for start, sep in product(command_start, command_sep):
-                    self.char_trie.add_prefix(
-                        f"{start}{sep.join(command)}", TRIE_VALUE(start, command)
-                    )
+        _add_command_prefixes(self.cmds, bot)
 
     def __repr__(self) -> str:
         return f"Command(cmds={self.cmds})"
 
     def __eq__(self, other: object) -> bool:
-        return isinstance(other, CommandRule) and frozenset(self.cmds) == frozenset(other.cmds)
+        return isinstance(other, CommandRule) and self._key == other._key
 
     def __hash__(self) -> int:
-        return hash((frozenset(self.cmds),))
+        return self._hash
 
     async def __call__(
         self,
         event: Event,
         state: StateT,
     ) -> bool:
-        self.char_trie.get_value(event, state)
+        _COMMAND_TRIE.get_value(event, state)
 
         cmd = state[PREFIX_KEY][CMD_KEY]
         cmd_arg = state[PREFIX_KEY][CMD_ARG_KEY]
         cmd_whitespace = state[PREFIX_KEY][CMD_WHITESPACE_KEY]
 
-        if cmd not in self.cmds:
+        if cmd not in self._key:
             return False
         if self.force_whitespace is None or not cmd_arg:
             return True
@@ -718,36 +890,23 @@ class ShellCommandRule:
         parser: 可选参数解析器
     """
 
-    __slots__ = ("cmds", "parser", "char_trie")
+    __slots__ = ("cmds", "parser", "_key", "_hash")
 
-    def __init__(self, cmds: list[tuple[str, ...]], parser: ArgumentParser | None):
+    def __init__(self, cmds: Sequence[str | tuple[str, ...]], parser: ArgumentParser | None):
         if parser is not None and not isinstance(parser, ArgumentParser):
             raise TypeError("`parser` must be an instance of nonebot.rule.ArgumentParser")
 
-        self.cmds = tuple(cmds)
+        self.cmds = _normalize_commands(cmds)
         self.parser = parser
-        self.char_trie = TrieRule()
+        self._key = frozenset(self.cmds)
+        self._hash = hash((self._key, parser))
 
         from sekaibot.bot import Bot
 
         Bot.bot_startup_hook(self._set_prefix)
 
     def _set_prefix(self, bot: "Bot"):
-        command_start = bot.config.rule.command_start
-        command_sep = bot.config.rule.command_sep
-        commands: list[tuple[str, ...]] = []
-        for command in self.cmds:
-            if isinstance(command, str):
-                command = (command,)
-
-            commands.append(command)
-
-            if len(command) == 1:
-                for start in command_start:
-                    TrieRule.add_prefix(f"{start}{command[0]}", TRIE_VALUE(start, command))
-            else:
-                for start, sep in product(command_start, command_sep):
-                    TrieRule.add_prefix(f"{start}{sep.join(command)}", TRIE_VALUE(start, command))
+        _add_command_prefixes(self.cmds, bot)
 
     def __repr__(self) -> str:
         return f"ShellCommand(cmds={self.cmds}, parser={self.parser})"
@@ -755,31 +914,31 @@ class ShellCommandRule:
     def __eq__(self, other: object) -> bool:
         return (
             isinstance(other, ShellCommandRule)
-            and frozenset(self.cmds) == frozenset(other.cmds)
+            and self._key == other._key
             and self.parser is other.parser
         )
 
     def __hash__(self) -> int:
-        return hash((frozenset(self.cmds), self.parser))
+        return self._hash
 
     async def __call__(
         self,
         event: Event,
         state: StateT,
     ) -> bool:
-        self.char_trie.get_value(event, state)
+        _COMMAND_TRIE.get_value(event, state)
 
         cmd = state[PREFIX_KEY][CMD_KEY]
         msg = state[PREFIX_KEY][CMD_ARG_KEY]
 
-        if cmd not in self.cmds or msg is None:
+        if cmd not in self._key or msg is None:
             return False
 
         try:
+            # 每个文本段单独切分，参数不会跨越消息段
             state[SHELL_ARGV] = list(
                 chain.from_iterable(
-                    shlex.split(str(seg)) if cast(MessageSegment, seg).is_text() else (seg,)
-                    for seg in msg
+                    shlex.split(str(seg)) if seg.is_text() else (seg,) for seg in msg
                 )
             )
         except Exception as e:
@@ -818,8 +977,16 @@ class ToMeRule:
     def __hash__(self) -> int:
         return hash((self.__class__,))
 
+    @staticmethod
+    def is_tome(event: Event) -> bool:
+        """获取事件是否与机器人有关，结果缓存在事件上。"""
+        tome = event._tome  # pyright: ignore[reportPrivateUsage]
+        if tome is None:
+            tome = event._tome = event.is_tome()  # pyright: ignore[reportPrivateUsage]
+        return tome
+
     async def __call__(self, event: Event) -> bool:
-        return event.is_tome()
+        return self.is_tome(event)
 
 
 __autodoc__ = {
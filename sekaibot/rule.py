@@ -1,4 +1,5 @@
 import re
+from functools import cache
 from typing import Any, Callable, Literal, overload, override  # noqa: UP035
 
 from sekaibot.consts import (
@@ -51,9 +52,17 @@ __all__ = [
 ]
 
 
+@cache
+def _state_depends(getter: Callable[..., Any]) -> Any:
+    """返回获取检查器数据的子依赖，相同的获取函数共享同一个子依赖对象。"""
+    return Depends(getter, use_cache=False)
+
+
 class StartsWith(RuleChecker[tuple[tuple[str | MessageSegment, ...], bool]]):
     """匹配消息富文本开头。"""
 
+    __slots__ = ()
+
     def __init__(self, *msgs: str | MessageSegment, ignorecase: bool = False) -> None:
         """匹配消息富文本开头。
 
@@ -72,7 +81,7 @@ class StartsWith(RuleChecker[tuple[tuple[str | MessageSegment, ...], bool]]):
             msgs: 指定消息开头字符串或 MessageSegment 元组
             ignorecase: 是否忽略大小写
         """
-        return super().Checker(msgs, ignorecase=ignorecase)
+        return super().Checker(*msgs, ignorecase=ignorecase)
 
     @staticmethod
     def _param(state: StateT):
@@ -81,12 +90,14 @@ class StartsWith(RuleChecker[tuple[tuple[str | MessageSegment, ...], bool]]):
     @classmethod
     def Param(cls) -> str | MessageSegment:
         """在依赖注入里获取检查器的数据。"""
-        return Depends(cls._param, use_cache=False)
+        return _state_depends(cls._param)
 
 
 class EndsWith(RuleChecker[tuple[tuple[str | MessageSegment, ...], bool]]):
     """匹配消息富文本结尾。"""
 
+    __slots__ = ()
+
     def __init__(self, *msgs: str | MessageSegment, ignorecase: bool = False) -> None:
         """匹配消息富文本结尾。
 
@@ -105,7 +116,7 @@ class EndsWith(RuleChecker[tuple[tuple[str | MessageSegment, ...], bool]]):
             msgs: 指定消息结尾字符串或 MessageSegment 元组
             ignorecase: 是否忽略大小写
         """
-        return super().Checker(msgs, ignorecase=ignorecase)
+        return super().Checker(*msgs, ignorecase=ignorecase)
 
     @staticmethod
     def _param(state: StateT):
@@ -114,12 +125,14 @@ class EndsWith(RuleChecker[tuple[tuple[str | MessageSegment, ...], bool]]):
     @classmethod
     def Param(cls) -> str | MessageSegment:
         """在依赖注入里获取检查器的数据。"""
-        return Depends(cls._param, use_cache=False)
+        return _state_depends(cls._param)
 
 
 class FullMatch(RuleChecker[tuple[tuple[str | Message | MessageSegment, ...], bool]]):
     """完全匹配消息。"""
 
+    __slots__ = ()
+
     def __init__(self, *msg: str | Message | MessageSegment, ignorecase: bool = False) -> None:
         """完全匹配消息。
 
@@ -138,7 +151,7 @@ class FullMatch(RuleChecker[tuple[tuple[str | Message | MessageSegment, ...], bo
             msg: 指定消息全匹配字符串或 Message 或 MessageSegment 元组
             ignorecase: 是否忽略大小写
         """
-        return super().Checker(msgs, ignorecase=ignorecase)
+        return super().Checker(*msgs, ignorecase=ignorecase)
 
     @staticmethod
     def _param(state: StateT):
@@ -147,12 +160,14 @@ class FullMatch(RuleChecker[tuple[tuple[str | Message | MessageSegment, ...], bo
     @classmethod
     def Param(cls) -> str | Message:
         """在依赖注入里获取检查器的数据。"""
-        return Depends(cls._param, use_cache=False)
+        return _state_depends(cls._param)
 
 
 class Keywords(RuleChecker[tuple[tuple[str | MessageSegment, ...], bool]]):
     """匹配消息富文本关键词。"""
 
+    __slots__ = ()
+
     def __init__(self, *keywords: str | MessageSegment, ignorecase: bool = False) -> None:
         """匹配消息富文本关键词。
 
@@ -171,7 +186,7 @@ class Keywords(RuleChecker[tuple[tuple[str | MessageSegment, ...], bool]]):
             keywords: 指定关键字元组
             ignorecase: 是否忽略大小写
         """
-        return super().Checker(keywords, ignorecase=ignorecase)
+        return super().Checker(*keywords, ignorecase=ignorecase)
 
     @staticmethod
     def _param(state: StateT):
@@ -180,12 +195,14 @@ class Keywords(RuleChecker[tuple[tuple[str | MessageSegment, ...], bool]]):
     @classmethod
     def Param(cls) -> tuple[str | MessageSegment, ...]:
         """在依赖注入里获取检查器的数据。"""
-        return Depends(cls._param, use_cache=False)
+        return _state_depends(cls._param)
 
 
 class WordFilter(RuleChecker[tuple[tuple[str, ...], str, bool, bool]]):
     """检查消息纯文本是不包含指定关键字，用于敏感词过滤。"""
 
+    __slots__ = ()
+
     def __init__(
         self,
         *words: str,
@@ -233,11 +250,15 @@ class WordFilter(RuleChecker[tuple[tuple[str, ...], str, bool, bool]]):
             use_aho: 是否启用 Aho-Corasick 算法（当词数较大时自动激活），使用 `pyahocorasick` 库
         """
         return super().Checker(
-            word_file=word_file, words=words, ignorecase=ignorecase, use_pinyin=use_pinyin, use_aho=use_aho
+            *words,
+            word_file=word_file,
+            ignorecase=ignorecase,
+            use_pinyin=use_pinyin,
+            use_aho=use_aho,
         )
 
 
-class Regex(RuleChecker[tuple[str, re.RegexFlag]]):
+class Regex(RuleChecker[tuple[str | re.Pattern[str], re.RegexFlag]]):
     """匹配符合正则表达式的消息字符串。
 
     Depends:
@@ -246,7 +267,7 @@ class Regex(RuleChecker[tuple[str, re.RegexFlag]]):
         {ref}`sekaibot.rule.Regex.RegexDict`: 获取匹配成功的 group 字典。
 
     Args:
-        regex: 正则表达式
+        regex: 正则表达式或已编译的正则表达式
         flags: 正则表达式标记
 
     Tip:
@@ -255,22 +276,24 @@ class Regex(RuleChecker[tuple[str, re.RegexFlag]]):
         而非 `EventMessage` 的 `PlainText` 纯文本字符串。
     """
 
-    def __init__(self, regex: str, flags: int | re.RegexFlag = 0):
+    __slots__ = ()
+
+    def __init__(self, regex: str | re.Pattern[str], flags: int | re.RegexFlag = 0):
         """匹配符合正则表达式的消息字符串。
 
         Args:
-            regex: 正则表达式
+            regex: 正则表达式或已编译的正则表达式
             flags: 正则表达式标记
         """
         super().__init__(RegexRule(regex, flags))
 
     @override
     @classmethod
-    def Checker(cls, regex: str, flags: int | re.RegexFlag = 0):
+    def Checker(cls, regex: str | re.Pattern[str], flags: int | re.RegexFlag = 0):
         """匹配符合正则表达式的消息字符串。
 
         Args:
-            regex: 正则表达式
+            regex: 正则表达式或已编译的正则表达式
             flags: 正则表达式标记
         """
         return super().Checker(regex, flags)
@@ -282,9 +305,10 @@ class Regex(RuleChecker[tuple[str, re.RegexFlag]]):
     @classmethod
     def RegexMatched(cls) -> re.Match[str]:
         """正则匹配结果"""
-        return Depends(cls._regex_matched, use_cache=False)
+        return _state_depends(cls._regex_matched)
 
     @classmethod
+    @cache
     def _regex_str(
         cls,
         groups: tuple[str | int, ...],
@@ -292,7 +316,7 @@ class Regex(RuleChecker[tuple[str, re.RegexFlag]]):
         def _regex_str_dependency(
             state: StateT,
         ) -> str | tuple[str | Any, ...] | Any:
-            return cls._regex_matched(state).group(*groups)
+            return state[REGEX_MATCHED].group(*groups)
 
         return _regex_str_dependency
 
@@ -313,36 +337,40 @@ class Regex(RuleChecker[tuple[str, re.RegexFlag]]):
     @classmethod
     def RegexStr(cls, *groups: str | int) -> str | tuple[str | Any, ...] | Any:
         """正则匹配结果文本"""
-        return Depends(cls._regex_str(groups), use_cache=False)
+        return _state_depends(cls._regex_str(groups))
 
     @classmethod
+    @cache
     def _regex_group(cls) -> tuple[Any, ...]:
         def _regex_group_dependency(state: StateT) -> Callable[[StateT], tuple[Any, ...]]:
-            return cls._regex_matched(state).groups()
+            return state[REGEX_MATCHED].groups()
 
         return _regex_group_dependency
 
     @classmethod
     def RegexGroup(cls) -> tuple[Any, ...]:
         """正则匹配结果 group 元组"""
-        return Depends(cls._regex_group(), use_cache=False)
+        return _state_depends(cls._regex_group())
 
     @classmethod
+    @cache
     def _regex_dict(cls) -> Callable[[StateT], dict[str, Any]]:
         def _regex_dict_dependency(state: StateT) -> dict[str, Any]:
-            return cls._regex_matched(state).groupdict()
+            return state[REGEX_MATCHED].groupdict()
 
         return _regex_dict_dependency
 
     @classmethod
     def RegexDict(cls) -> dict[str, Any]:
         """正则匹配结果 group 字典"""
-        return Depends(cls._regex_dict(), use_cache=False)
+        return _state_depends(cls._regex_dict())
 
 
 class CountTrigger(RuleChecker[tuple[str, Dependency[bool], int, int, int, int]]):
     """计数器规则。"""
 
+    __slots__ = ()
+
     def __init__(
         self,
         name: str,
@@ -363,7 +391,13 @@ class CountTrigger(RuleChecker[tuple[str, Dependency[bool], int, int, int, int]]
             max_size: 最大缓存大小
         """
         super().__init__(
-            CountTriggerRule(name, func, min_trigger, time_window, count_window, max_size)
+            CountTriggerRule(
+                time_window=time_window,
+                count_window=count_window,
+                min_trigger=min_trigger,
+                max_size=max_size,
+                rule=None if func is None else Rule(func),
+            )
         )
 
     @override
@@ -387,7 +421,7 @@ class CountTrigger(RuleChecker[tuple[str, Dependency[bool], int, int, int, int]]
             count_window: 计数窗口（秒）
             max_size: 最大缓存大小
         """
-        return super().Checker(name, name, func, min_trigger, time_window, count_window, max_size)
+        return super().Checker(name, func, min_trigger, time_window, count_window, max_size)
 
     @staticmethod
     def _time_trigger(state: StateT) -> tuple[Event, ...]:
@@ -396,7 +430,7 @@ class CountTrigger(RuleChecker[tuple[str, Dependency[bool], int, int, int, int]]
     @classmethod
     def TimeTrigger(cls):
         """在依赖注入里获取检查器的数据。"""
-        return Depends(cls._time_trigger, use_cache=False)
+        return _state_depends(cls._time_trigger)
 
     def _latest_trigger(state: StateT) -> tuple[Event, ...]:
         return state[COUNTER_LATEST_TIGGERS]
@@ -404,7 +438,7 @@ class CountTrigger(RuleChecker[tuple[str, Dependency[bool], int, int, int, int]]
     @classmethod
     def LatestTrigger(cls):
         """在依赖注入里获取检查器的数据。"""
-        return Depends(cls._latest_trigger, use_cache=False)
+        return _state_depends(cls._latest_trigger)
 
 
 class Command(RuleChecker[tuple[tuple[str, ...], str | bool | None]]):
@@ -429,6 +463,8 @@ class Command(RuleChecker[tuple[tuple[str, ...], str | bool | None]]):
         - 命令 `("test", "sub")` 可以匹配以 `/test.sub` 开头的消息
     """
 
+    __slots__ = ()
+
     def __init__(self, *cmds: tuple[str, ...], force_whitespace: str | bool | None = None) -> None:
         """匹配消息命令。
 
@@ -436,7 +472,7 @@ class Command(RuleChecker[tuple[tuple[str, ...], str | bool | None]]):
             cmds (str | tuple[str, ...]): 命令文本或命令元组。
             force_whitespace (bool): 是否强制命令后必须有空白符（如空格、换行等）。
         """
-        super().__init__(CommandRule(*cmds, force_whitespace=force_whitespace))
+        super().__init__(CommandRule(cmds, force_whitespace=force_whitespace))
 
     @override
     @classmethod
@@ -456,7 +492,7 @@ class Command(RuleChecker[tuple[tuple[str, ...], str | bool | None]]):
     @classmethod
     def Command(cls):
         """消息命令元组"""
-        return Depends(cls._command, use_cache=False)
+        return _state_depends(cls._command)
 
     @staticmethod
     def _raw_command(state: StateT) -> str:
@@ -465,7 +501,7 @@ class Command(RuleChecker[tuple[tuple[str, ...], str | bool | None]]):
     @classmethod
     def RawCommand(cls):
         """消息命令文本"""
-        return Depends(cls._raw_command, use_cache=False)
+        return _state_depends(cls._raw_command)
 
     @staticmethod
     def _command_arg(state: StateT) -> Any:
@@ -474,7 +510,7 @@ class Command(RuleChecker[tuple[tuple[str, ...], str | bool | None]]):
     @classmethod
     def CommandArg(cls):
         """消息命令参数"""
-        return Depends(cls._command_arg, use_cache=False)
+        return _state_depends(cls._command_arg)
 
     @staticmethod
     def _command_start(state: StateT) -> str:
@@ -483,7 +519,7 @@ class Command(RuleChecker[tuple[tuple[str, ...], str | bool | None]]):
     @classmethod
     def CommandStart(cls):
         """消息命令开头"""
-        return Depends(cls._command_start, use_cache=False)
+        return _state_depends(cls._command_start)
 
     @staticmethod
     def _command_whitespace(state: StateT) -> str:
@@ -492,7 +528,7 @@ class Command(RuleChecker[tuple[tuple[str, ...], str | bool | None]]):
     @classmethod
     def CommandWhitespace(cls):
         """消息命令与参数之间的空白"""
-        return Depends(cls._command_whitespace, use_cache=False)
+        return _state_depends(cls._command_whitespace)
 
 
 class ShellCommand(Command, RuleChecker[tuple[tuple[str, ...], ArgumentParser | None]]):
@@ -528,6 +564,8 @@ class ShellCommand(Command, RuleChecker[tuple[tuple[str, ...], ArgumentParser |
         ```
     """
 
+    __slots__ = ()
+
     def __init__(self, *cmds: tuple[str, ...], parser: ArgumentParser | None = None) -> None:
         """匹配 `shell_like` 形式的消息命令。
 
@@ -535,7 +573,8 @@ class ShellCommand(Command, RuleChecker[tuple[tuple[str, ...], ArgumentParser |
             cmds (str | tuple[str, ...]): 命令文本或命令元组。
             parser (ArgumentParser | None): 可选的 `{ref}sekaibot.rule.ArgumentParser` 对象。
         """
-        super().__init__(ShellCommandRule(*cmds, parser=parser))
+        # 跳过 Command.__init__，直接以 ShellCommandRule 初始化检查器
+        RuleChecker.__init__(self, ShellCommandRule(cmds, parser=parser))
 
     @override
     @classmethod
@@ -555,7 +594,7 @@ class ShellCommand(Command, RuleChecker[tuple[tuple[str, ...], ArgumentParser |
     @classmethod
     def ShellCommandArgs(cls) -> Any:
         """shell 命令解析后的参数字典"""
-        return Depends(cls._shell_command_args, use_cache=False)
+        return _state_depends(cls._shell_command_args)
 
     @staticmethod
     def _shell_command_argv(state: StateT) -> list[str | MessageSegment]:
@@ -564,12 +603,14 @@ class ShellCommand(Command, RuleChecker[tuple[tuple[str, ...], ArgumentParser |
     @classmethod
     def ShellCommandArgv(cls) -> Any:
         """shell 命令原始参数列表"""
-        return Depends(cls._shell_command_argv, use_cache=False)
+        return _state_depends(cls._shell_command_argv)
 
 
 class ToMe(RuleChecker[Any]):
     """匹配与机器人有关的事件。"""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(ToMeRule())
 
@@ -580,9 +621,9 @@ class ToMe(RuleChecker[Any]):
 
     @staticmethod
     def _param(event: Event) -> bool:
-        return event.is_tome()
+        return ToMeRule.is_tome(event)
 
     @classmethod
     def Param(cls) -> dict:
         """在依赖注入里获取检查器的数据。"""
-        return Depends(cls._param, use_cache=False)
+        return _state_depends(cls._param)
@@ -6,6 +6,7 @@ from sekaibot.utils.bot import (
     cancel_on_exit,
     flatten_exception_group,
     flatten_tree_with_jumps,
+    fold_case,
     get_annotations,
     get_classes_from_module,
     get_classes_from_module_name,
@@ -32,6 +33,7 @@ __all__ = [
     "TTLCache",
     "flatten_exception_group",
     "flatten_tree_with_jumps",
+    "fold_case",
     "get_annotations",
     "get_classes_from_module",
     "get_classes_from_module_name",
@@ -45,6 +45,7 @@ __all__ = [
     "run_coro_with_catch",
     "PydanticEncoder",
     "samefile",
+    "fold_case",
     "sync_func_wrapper",
     "sync_ctx_manager_wrapper",
     "wrap_get_func",
@@ -321,6 +322,21 @@ def samefile(path1: StrOrBytesPath, path2: StrOrBytesPath) -> bool:
         return False
 
 
+def fold_case(text: str) -> str:
+    """忽略大小写比较时使用的字符串折叠。
+
+    纯 ASCII 字符串使用更快的 `str.lower()`，其结果与 `str.casefold()` 相同；
+    其余字符串使用 `str.casefold()`。
+
+    Args:
+        text: 需要折叠的字符串。
+
+    Returns:
+        折叠后的字符串。
+    """
+    return text.lower() if text.isascii() else text.casefold()
+
+
 def sync_func_wrapper(
     func: Callable[_P, _R], *, to_thread: bool = False
 ) -> Callable[_P, Coroutine[None, None, _R]]:
@@ -372,6 +388,11 @@ async def sync_ctx_manager_wrapper(
         await sync_func_wrapper(cm.__exit__, to_thread=to_thread)(None, None, None)
 
 
+async def _get_func_always_true(_event: Any) -> bool:
+    """`get()` 未指定条件时使用的判断函数，对于任何事件均返回 `True`。"""
+    return True
+
+
 def wrap_get_func(
     func: Callable[[EventT], bool | Awaitable[bool]] | None = None,
     *,
@@ -389,10 +410,14 @@ def wrap_get_func(
         异步函数。
     """
     if func is None:
-        func = sync_func_wrapper(lambda _: True)
+        func = _get_func_always_true
     elif not inspect.iscoroutinefunction(func):
         func = sync_func_wrapper(cast(Callable[[EventT], bool], func))
 
+    if event_type is None and adapter_type is None:
+        # 无需额外检查时直接返回，避免多包装一层协程
+        return cast(Callable[[EventT], Awaitable[bool]], func)
+
     async def _func(event: EventT) -> bool:
         return (
             (event_type is None or isinstance(event, event_type))
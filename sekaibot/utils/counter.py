@@ -3,6 +3,7 @@ import time as time_util
 from collections import deque
 from collections.abc import Callable, Iterator
 from dataclasses import asdict, dataclass
+from itertools import islice
 from typing import Any, Generic, TypeVar
 
 T = TypeVar("T")
@@ -96,7 +97,7 @@ class Counter(Generic[T]):
             命中事件数量。
         """
         now = now if now is not None else self._time()
-        return sum(1 for e in self._events if e.matched and now - seconds <= e.timestamp < now)
+        return sum(1 for e in self._iter_in_time(seconds, now) if e.matched)
 
     def count_in_latest(self, n: int) -> int:
         """
@@ -108,7 +109,31 @@ class Counter(Generic[T]):
         Returns:
             命中事件数量。
         """
-        return sum(1 for e in list(self._events)[-n:] if e.matched)
+        return sum(1 for e in self._iter_latest(n) if e.matched)
+
+    def _iter_in_time(self, seconds: float, now: float) -> list[RecordedEvent[T]]:
+        """获取时间窗口内的记录（时间升序）。
+
+        记录始终按时间升序保存，因此从最新一条向前扫描，越过窗口起点即可停止，
+        无需遍历窗口之外的旧记录。
+        """
+        start = now - seconds
+        window: list[RecordedEvent[T]] = []
+        for e in reversed(self._events):
+            if e.timestamp < start:
+                break
+            if e.timestamp < now:
+                window.append(e)
+        window.reverse()
+        return window
+
+    def _iter_latest(self, n: int) -> Iterator[RecordedEvent[T]]:
+        """迭代最近 n 条记录，不复制整个队列。
+
+        与切片 `[-n:]` 的结果一致：`n` 为 0 时迭代全部记录，为负数时跳过最早的 `-n` 条记录。
+        """
+        start = max(len(self._events) - n, 0) if n > 0 else -n
+        return islice(self._events, start, None)
 
     def count_matched(self) -> int:
         """
@@ -150,7 +175,7 @@ class Counter(Generic[T]):
             事件迭代器。
         """
         now = now if now is not None else self._time()
-        return (e.event for e in self._events if e.matched and now - seconds <= e.timestamp < now)
+        return (e.event for e in self._iter_in_time(seconds, now) if e.matched)
     
     def iter_in_latest(self, n: int) -> Iterator[T]:
         """
@@ -162,7 +187,7 @@ class Counter(Generic[T]):
         Returns:
             事件迭代器。
         """
-        return (e.event for e in list(self._events)[-n:] if e.matched)
+        return (e.event for e in self._iter_latest(n) if e.matched)
 
     def iter_matched(self) -> Iterator[T]:
         """
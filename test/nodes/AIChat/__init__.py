@@ -5,6 +5,11 @@ from sekaibot.adapter.cqhttp.event import MessageEvent
 from sekaibot.dependencies import Depends
 from sekaibot.rule import ToMe
 
+_BLOCKED_USERS: frozenset[int] = frozenset({2854196310})
+"""不响应其消息的用户"""
+_BLOCKED_TEXTS: tuple[str, ...] = ("请使用最新版本",)
+"""包含这些内容的消息不响应"""
+
 @ToMe()
 class NormalMsg(Node[MessageEvent, dict, Any]):
     priority: int = 2
@@ -17,9 +22,8 @@ class NormalMsg(Node[MessageEvent, dict, Any]):
         await self.response.respond_to_message(if_music=True, if_img=False)
 
     async def rule(self) -> bool:
-        print(self.event.is_tome())
-        if "请使用最新版本" in self.event.get_plain_text():
-            return False
-        if self.event.user_id == 2854196310:
+        # 先比较用户，命中时无需获取消息文本
+        if self.event.user_id in _BLOCKED_USERS:
             return False
-        return True
+        text = self.event.get_plain_text()
+        return not any(blocked in text for blocked in _BLOCKED_TEXTS)
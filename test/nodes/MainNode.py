@@ -1,6 +1,7 @@
 # from typing import Any
 
 import random
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from _randsent import generate_sentence
@@ -16,6 +17,52 @@ def a(event: Event):
     print(event.get_event_name())
 
 
+_SENTENCE_TEMPLATES: tuple[str, ...] = (
+    "{keyw}鞭好粗",
+    "{keyw}鞭好大",
+    "香草{keyw}",
+    "香茶{keyw}",
+    "{keyw}好可爱",
+    "{keyw}立了",
+    "香甜{keyw}",
+    "{keyw}草我",
+    "诶我草{keyw}怎么这么坏啊",
+    "被{keyw}茶了",
+    "{keyw}是四爱",
+    "{keyw}是4i",
+    "{keyw}是南通",
+    "{keyw}素指南",
+    "{keyw}就是爱慕",
+    "{keyw}是正太",
+    "{keyw}不见了",
+    "{keyw}蛇了",
+    "{keyw}北朝的初雪",
+    "{keyw}北朝的初水",
+    "{keyw}北朝的豪爽",
+    "香甜{keyw}的小学",
+    "北{keyw}顶到职场了",
+    "想吃{keyw}精",
+    "想吃{keyw}的大橘瓣",
+    "想电{keyw}的前列腺",
+    "{keyw}转过去一下我有急事",
+    "想吃{keyw}的高玩",
+    "{keyw}很带派",
+    "想吃{keyw}的大汗脚",
+    "被{keyw}口了",
+    "{keyw}是蓝凉",
+)
+"""随机回复使用的句子模板"""
+
+_NICKNAMES: dict[str, str] = {
+    "lrc": "林睿晨",
+    "xy": "香氤",
+    "sz": "松泽",
+    "sc": "思灿",
+    "yl": "Kotodama",
+}
+"""关键词缩写对应的称呼"""
+
+
 @Keywords(
     "/开",
     "/关",
@@ -40,78 +87,59 @@ class AutoReply(Node[GroupMessageEvent, dict, Any]):
     zb = Keywords.Param()
     block = True
 
+    def __init_state__(self) -> dict:
+        return {"sound": False, "character": "lucy-voice-guangdong-f1"}
+
     async def handle(self):
-        keyw = self.zb[0] if self.zb else "蒸"
-        if "sound" not in self.node_state:
-            self.node_state["sound"] = False
-        if "character" not in self.node_state:
-            self.node_state["character"] = "lucy-voice-guangdong-f1"
-
-        if keyw == "/开":
-            self.node_state["sound"] = True
-            await self.reply("已开启语音回复", at_sender=True)
-        elif keyw == "/关":
-            self.node_state["sound"] = False
-            await self.reply("已关闭语音回复", at_sender=True)
-        elif keyw == "/角色列表":
-            await self.reply(get_character_name_list_text())
-        elif keyw == "/角色":
-            if _id := parse_character_command(self.event.get_plain_text()):
-                self.node_state["character"] = _id
-                await self.reply(f"已成功切换角色：{_id}", at_sender=True)
-            else:
-                await self.reply("切换失败，请检查", at_sender=True)
+        message = self.event.get_plain_text()
+        if message.startswith("/"):
+            # 按最长前缀匹配指令，避免 `/角色` 抢先匹配 `/角色列表`
+            for prefix in _COMMAND_PREFIXES:
+                if message.startswith(prefix):
+                    await _COMMANDS[prefix](self)
+                    return
+
+        keyw = next((keyword for keyword in self.zb if keyword not in _COMMANDS), "蒸")
+
+        text = random.choice(_SENTENCE_TEMPLATES).format(keyw=_NICKNAMES.get(keyw, keyw))
+        if self.node_state["sound"] and self.event.message_type == "group":
+            await self.call_api(
+                "send_group_ai_record",
+                character=self.node_state["character"],
+                group_id=self.event.group_id,
+                text=text,
+            )
+        else:
+            await self.reply(text)
+
+    async def _sound_on(self):
+        self.node_state["sound"] = True
+        await self.reply("已开启语音回复", at_sender=True)
+
+    async def _sound_off(self):
+        self.node_state["sound"] = False
+        await self.reply("已关闭语音回复", at_sender=True)
+
+    async def _character_list(self):
+        await self.reply(get_character_name_list_text())
+
+    async def _switch_character(self):
+        if _id := parse_character_command(self.event.get_plain_text()):
+            self.node_state["character"] = _id
+            await self.reply(f"已成功切换角色：{_id}", at_sender=True)
         else:
-            keyw = "林睿晨" if keyw == "lrc" else keyw
-            keyw = "香氤" if keyw == "xy" else keyw
-            keyw = "松泽" if keyw == "sz" else keyw
-            keyw = "思灿" if keyw == "sc" else keyw
-            keyw = "Kotodama" if keyw == "yl" else keyw
-            text = random.choice(
-                (
-                    "{keyw}鞭好粗",
-                    "{keyw}鞭好大",
-                    "香草{keyw}",
-                    "香茶{keyw}",
-                    "{keyw}好可爱",
-                    "{keyw}立了",
-                    "香甜{keyw}",
-                    "{keyw}草我",
-                    "诶我草{keyw}怎么这么坏啊",
-                    "被{keyw}茶了",
-                    "{keyw}是四爱",
-                    "{keyw}是4i",
-                    "{keyw}是南通",
-                    "{keyw}素指南",
-                    "{keyw}就是爱慕",
-                    "{keyw}是正太",
-                    "{keyw}不见了",
-                    "{keyw}蛇了",
-                    "{keyw}北朝的初雪",
-                    "{keyw}北朝的初水",
-                    "{keyw}北朝的豪爽",
-                    "香甜{keyw}的小学",
-                    "北{keyw}顶到职场了",
-                    "想吃{keyw}精",
-                    "想吃{keyw}的大橘瓣",
-                    "想电{keyw}的前列腺",
-                    "{keyw}转过去一下我有急事",
-                    "想吃{keyw}的高玩",
-                    "{keyw}很带派",
-                    "想吃{keyw}的大汗脚",
-                    "被{keyw}口了",
-                    "{keyw}是蓝凉",
-                )
-            ).format(keyw=keyw)
-            if self.node_state["sound"] and self.event.message_type == "group":
-                await self.call_api(
-                    "send_group_ai_record",
-                    character=self.node_state["character"],
-                    group_id=self.event.group_id,
-                    text=text,
-                )
-            else:
-                await self.reply(text)
+            await self.reply("切换失败，请检查", at_sender=True)
+
+
+_COMMANDS: dict[str, Callable[[AutoReply], Awaitable[None]]] = {
+    "/开": AutoReply._sound_on,
+    "/关": AutoReply._sound_off,
+    "/角色列表": AutoReply._character_list,
+    "/角色": AutoReply._switch_character,
+}
+"""AutoReply 的指令关键词及其处理方法"""
+_COMMAND_PREFIXES: tuple[str, ...] = tuple(sorted(_COMMANDS, key=len, reverse=True))
+"""按长度从长到短排列的指令关键词"""
 
 
 @StartsWith("/唐")
@@ -0,0 +1,44 @@
+"""EventType 不匹配的 block 父节点只跳过自身，其子节点仍会处理事件。
+
+收到群消息时，`PokeBlockParent` 因事件类型不匹配被跳过，
+`PokeBlockChild` 与 `NoMatchBlockChild` 都应当回复。
+"""
+
+from typing import Any
+
+from sekaibot import Node
+from sekaibot.adapter.cqhttp.event import GroupMessageEvent, PokeNotifyEvent
+from sekaibot.rule import FullMatch
+
+
+class PokeBlockParent(Node[PokeNotifyEvent, Any, Any]):
+    priority: int = 0
+    block: bool = True
+
+    async def handle(self) -> None:
+        await self.reply("PokeBlockParent")
+
+
+@FullMatch("/block")
+class PokeBlockChild(Node[GroupMessageEvent, Any, Any]):
+    parent: str = "PokeBlockParent"
+
+    async def handle(self) -> None:
+        await self.reply("PokeBlockChild")
+
+
+class NoMatchBlockParent(Node[GroupMessageEvent, Any, Any]):
+    EventType: str = "nomatch"
+    priority: int = 1
+    block: bool = True
+
+    async def handle(self) -> None:
+        await self.reply("NoMatchBlockParent")
+
+
+@FullMatch("/block")
+class NoMatchBlockChild(Node[GroupMessageEvent, Any, Any]):
+    parent: str = "NoMatchBlockParent"
+
+    async def handle(self) -> None:
+        await self.reply("NoMatchBlockChild")